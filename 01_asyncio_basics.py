@@ -4,8 +4,67 @@ asyncio 기초 예제
 """
 
 import asyncio
+import atexit
+import os
+import queue
+import sys
+import threading
 import time
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import uvloop  # libuv 기반 고성능 이벤트 루프 (POSIX 전용, 선택 사항)
+except ImportError:
+    uvloop = None
+
+# BENCH=1 환경 변수로 실행하면 출력을 끄고 스케줄러 벤치마크만 실행
+SILENT = os.environ.get("BENCH") == "1"
+
+# 출력은 전용 스레드가 담당 - 이벤트 루프가 stdout 쓰기에 막히지 않도록 함
+_log_queue: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+
+
+def _log_writer() -> None:
+    """큐에서 꺼낸 줄을 stdout에 쓰는 스레드 본체 (None을 받으면 종료)"""
+    while (line := _log_queue.get()) is not None:
+        sys.stdout.write(line + "\n")
+    sys.stdout.flush()
+
+
+_log_thread = threading.Thread(target=_log_writer, name="log-writer", daemon=True)
+_log_thread.start()
+
+
+def log(message: str = "") -> None:
+    """
+    메시지를 출력 큐에 넣습니다 (print 대신 사용).
+
+    Args:
+        message: 출력할 문자열
+    """
+    if SILENT:
+        return
+    _log_queue.put(message)
+
+
+@atexit.register
+def _flush_log() -> None:
+    """프로그램 종료 시 큐에 남은 출력을 모두 내보냄"""
+    _log_queue.put(None)
+    _log_thread.join()
+
+
+@lru_cache(maxsize=1024)
+def _task_result_message(name: str, delay: float) -> str:
+    """(작업 이름, 대기 시간)에 대한 완료 메시지 (결정적이므로 캐시)"""
+    return f"{name} 작업이 {delay}초 후 완료되었습니다"
+
+
+@lru_cache(maxsize=1024)
+def _fetch_template(url: str) -> str:
+    """URL에 대한 가상 데이터 문자열 (URL에만 의존하므로 캐시)"""
+    return f"URL {url}에서 가져온 데이터"
 
 
 async def simple_task(name: str, delay: float) -> str:
@@ -19,10 +78,23 @@ async def simple_task(name: str, delay: float) -> str:
     Returns:
         완료 메시지
     """
-    print(f"작업 {name} 시작")
+    log(f"작업 {name} 시작")
     await asyncio.sleep(delay)  # 비동기 대기
-    print(f"작업 {name} 완료")
-    return f"{name} 작업이 {delay}초 후 완료되었습니다"
+    log(f"작업 {name} 완료")
+    return _task_result_message(name, delay)
+
+
+def use_eager_task_factory() -> None:
+    """
+    실행 중인 이벤트 루프에 eager 태스크 팩토리를 설정합니다.
+
+    Python 3.12+의 asyncio.eager_task_factory를 사용하면 태스크가 생성 즉시
+    첫 await까지 실행되므로, 블로킹 없이 끝나는 코루틴은 이벤트 루프를
+    거치지 않고 완료됩니다. 이전 버전에서는 아무 작업도 하지 않습니다.
+    """
+    factory = getattr(asyncio, "eager_task_factory", None)
+    if factory is not None:
+        asyncio.get_running_loop().set_task_factory(factory)
 
 
 async def fetch_data(url: str, delay: float) -> dict:
@@ -36,12 +108,12 @@ async def fetch_data(url: str, delay: float) -> dict:
     Returns:
         가상의 데이터
     """
-    print(f"데이터 요청: {url}")
+    log(f"데이터 요청: {url}")
     await asyncio.sleep(delay)
     return {
         "url": url,
-        "data": f"URL {url}에서 가져온 데이터",
-        "timestamp": time.time(),
+        "data": _fetch_template(url),
+        "timestamp": time.monotonic_ns(),  # 정수 나노초 (단조 증가)
     }
 
 
@@ -56,118 +128,115 @@ def sync_task(name: str, delay: float) -> str:
     Returns:
         완료 메시지
     """
-    print(f"동기 작업 {name} 시작")
+    log(f"동기 작업 {name} 시작")
     time.sleep(delay)  # 동기 대기 (블로킹)
-    print(f"동기 작업 {name} 완료")
-    return f"{name} 작업이 {delay}초 후 완료되었습니다"
+    log(f"동기 작업 {name} 완료")
+    return _task_result_message(name, delay)
 
 
 async def demo_sleep_difference():
     """time.sleep vs asyncio.sleep 차이점 데모"""
-    print("=== time.sleep vs asyncio.sleep 차이점 ===")
+    log("=== time.sleep vs asyncio.sleep 차이점 ===")
 
     async def async_task_with_sync_sleep(name: str, delay: float) -> str:
         """비동기 함수에서 time.sleep 사용 (잘못된 방법)"""
-        print(f"작업 {name} 시작 (time.sleep 사용)")
+        log(f"작업 {name} 시작 (time.sleep 사용)")
         time.sleep(delay)  # ❌ 이렇게 하면 안됨!
-        print(f"작업 {name} 완료")
+        log(f"작업 {name} 완료")
         return f"{name} 완료"
 
     async def async_task_with_async_sleep(name: str, delay: float) -> str:
         """비동기 함수에서 asyncio.sleep 사용 (올바른 방법)"""
-        print(f"작업 {name} 시작 (asyncio.sleep 사용)")
+        log(f"작업 {name} 시작 (asyncio.sleep 사용)")
         await asyncio.sleep(delay)  # ✅ 올바른 방법
-        print(f"작업 {name} 완료")
+        log(f"작업 {name} 완료")
         return f"{name} 완료"
 
     # 1. time.sleep을 사용한 잘못된 비동기 코드
-    print("\n--- time.sleep 사용 (잘못된 방법) ---")
-    start_time = time.time()
-    results1 = await asyncio.gather(
-        async_task_with_sync_sleep("A", 1.0),
-        async_task_with_sync_sleep("B", 1.0),
-        async_task_with_sync_sleep("C", 1.0),
-    )
-    end_time = time.time()
-    print(f"time.sleep 사용 시간: {end_time - start_time:.2f}초")
-    print("❌ time.sleep은 블로킹이므로 동시 실행이 안됨!")
+    log("\n--- time.sleep 사용 (잘못된 방법) ---")
+    # 코루틴 객체 생성은 측정 구간 밖에서 미리 수행
+    coros = [async_task_with_sync_sleep(name, 1.0) for name in ("A", "B", "C")]
+    start_time = time.perf_counter_ns()
+    results1 = await asyncio.gather(*coros)
+    end_time = time.perf_counter_ns()
+    log(f"time.sleep 사용 시간: {(end_time - start_time) / 1e9:.2f}초")
+    log("❌ time.sleep은 블로킹이므로 동시 실행이 안됨!")
 
     # 2. asyncio.sleep을 사용한 올바른 비동기 코드
-    print("\n--- asyncio.sleep 사용 (올바른 방법) ---")
-    start_time = time.time()
-    results2 = await asyncio.gather(
-        async_task_with_async_sleep("D", 1.0),
-        async_task_with_async_sleep("E", 1.0),
-        async_task_with_async_sleep("F", 1.0),
-    )
-    end_time = time.time()
-    print(f"asyncio.sleep 사용 시간: {end_time - start_time:.2f}초")
-    print("✅ asyncio.sleep은 논블로킹이므로 동시 실행됨!")
+    log("\n--- asyncio.sleep 사용 (올바른 방법) ---")
+    coros = [async_task_with_async_sleep(name, 1.0) for name in ("D", "E", "F")]
+    start_time = time.perf_counter_ns()
+    results2 = await asyncio.gather(*coros)
+    end_time = time.perf_counter_ns()
+    log(f"asyncio.sleep 사용 시간: {(end_time - start_time) / 1e9:.2f}초")
+    log("✅ asyncio.sleep은 논블로킹이므로 동시 실행됨!")
 
 
 async def main_basic():
     """기본적인 asyncio 사용법"""
-    print("=== asyncio 기본 예제 ===")
+    log("=== asyncio 기본 예제 ===")
 
     # 1. 단일 코루틴 실행
     result = await simple_task("A", 1.0)
-    print(f"결과: {result}")
+    log(f"결과: {result}")
 
     # 2. sleep 차이점 데모
     await demo_sleep_difference()
 
     # 3. 동기 함수로 순차 실행 (느림)
-    print("\n--- 동기 함수 순차 실행 ---")
-    start_time = time.time()
+    log("\n--- 동기 함수 순차 실행 ---")
+    start_time = time.perf_counter_ns()
     result1 = sync_task("B", 1.0)
     result2 = sync_task("C", 1.0)
-    end_time = time.time()
-    print(f"동기 순차 실행 시간: {end_time - start_time:.2f}초")
+    end_time = time.perf_counter_ns()
+    log(f"동기 순차 실행 시간: {(end_time - start_time) / 1e9:.2f}초")
 
     # 4. 비동기 함수로 순차 실행 (여전히 느림)
-    print("\n--- 비동기 함수 순차 실행 ---")
-    start_time = time.time()
+    log("\n--- 비동기 함수 순차 실행 ---")
+    start_time = time.perf_counter_ns()
     result1 = await simple_task("D", 1.0)
     result2 = await simple_task("E", 1.0)
-    end_time = time.time()
-    print(f"비동기 순차 실행 시간: {end_time - start_time:.2f}초")
-    print("💡 순차 실행은 동기/비동기 차이가 없습니다!")
+    end_time = time.perf_counter_ns()
+    log(f"비동기 순차 실행 시간: {(end_time - start_time) / 1e9:.2f}초")
+    log("💡 순차 실행은 동기/비동기 차이가 없습니다!")
 
 
 async def main_concurrent():
     """동시 실행 예제"""
-    print("\n=== 동시 실행 예제 ===")
+    log("\n=== 동시 실행 예제 ===")
+    use_eager_task_factory()
 
     # 1. 동기 함수로 순차 실행 (느림)
-    print("--- 동기 함수 순차 실행 ---")
-    start_time = time.time()
+    log("--- 동기 함수 순차 실행 ---")
+    start_time = time.perf_counter_ns()
     result1 = sync_task("G", 1.0)
     result2 = sync_task("H", 1.0)
     result3 = sync_task("I", 1.0)
-    end_time = time.time()
-    sync_time = end_time - start_time
-    print(f"동기 순차 실행 시간: {sync_time:.2f}초")
+    end_time = time.perf_counter_ns()
+    sync_time = (end_time - start_time) / 1e9
+    log(f"동기 순차 실행 시간: {sync_time:.2f}초")
 
     # 2. 비동기 함수로 동시 실행 (빠름)
-    print("\n--- 비동기 함수 동시 실행 ---")
-    start_time = time.time()
-    results = await asyncio.gather(
-        simple_task("J", 1.0), simple_task("K", 1.0), simple_task("L", 1.0)
-    )
-    end_time = time.time()
-    async_time = end_time - start_time
-    print(f"비동기 동시 실행 시간: {async_time:.2f}초")
-    print(f"결과들: {results}")
+    log("\n--- 비동기 함수 동시 실행 ---")
+    start_time = time.perf_counter_ns()
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(simple_task(n, 1.0)) for n in ("J", "K", "L")]
+    results = [task.result() for task in tasks]
+    end_time = time.perf_counter_ns()
+    async_time = (end_time - start_time) / 1e9
+    log(f"비동기 동시 실행 시간: {async_time:.2f}초")
+    log(f"결과들: {results}")
 
     # 3. 성능 비교
     speedup = sync_time / async_time if async_time > 0 else 0
-    print(f"\n🚀 비동기 동시 실행이 {speedup:.1f}배 빠릅니다!")
-    print(f"   시간 절약: {sync_time - async_time:.2f}초")
+    log(f"\n🚀 비동기 동시 실행이 {speedup:.1f}배 빠릅니다!")
+    log(f"   시간 절약: {sync_time - async_time:.2f}초")
 
 
 async def main_data_fetching():
     """데이터 페칭 시뮬레이션"""
-    print("\n=== 데이터 페칭 시뮬레이션 ===")
+    log("\n=== 데이터 페칭 시뮬레이션 ===")
+    use_eager_task_factory()
 
     urls = [
         "https://api.example.com/users",
@@ -176,55 +245,72 @@ async def main_data_fetching():
     ]
 
     # 동시에 여러 API 호출
-    start_time = time.time()
-    tasks = [fetch_data(url, 1.0) for url in urls]
-    results = await asyncio.gather(*tasks)
-    end_time = time.time()
+    start_time = time.perf_counter_ns()
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(fetch_data(url, 1.0)) for url in urls]
+    results = [task.result() for task in tasks]
+    end_time = time.perf_counter_ns()
 
-    print(f"모든 데이터 페칭 완료: {end_time - start_time:.2f}초")
+    log(f"모든 데이터 페칭 완료: {(end_time - start_time) / 1e9:.2f}초")
     for result in results:
-        print(f"  - {result['url']}: {result['data']}")
+        log(f"  - {result['url']}: {result['data']}")
 
 
 async def main_with_tasks():
     """Task 객체를 사용한 예제"""
-    print("\n=== Task 객체 사용 예제 ===")
+    log("\n=== Task 객체 사용 예제 ===")
+    use_eager_task_factory()
 
-    # Task 생성
-    task1 = asyncio.create_task(simple_task("Task1", 2.0))
-    task2 = asyncio.create_task(simple_task("Task2", 1.0))
-    task3 = asyncio.create_task(simple_task("Task3", 1.5))
+    # TaskGroup 안에서 Task 생성 - 블록을 벗어날 때 모든 작업 완료 대기
+    async with asyncio.TaskGroup() as tg:
+        task1 = tg.create_task(simple_task("Task1", 2.0))
+        task2 = tg.create_task(simple_task("Task2", 1.0))
+        task3 = tg.create_task(simple_task("Task3", 1.5))
 
-    # 모든 작업 완료 대기
-    results = await asyncio.gather(task1, task2, task3)
-    print(f"Task 결과들: {results}")
+    results = [task1.result(), task2.result(), task3.result()]
+    log(f"Task 결과들: {results}")
 
 
 async def main_with_timeout():
     """타임아웃 처리 예제"""
-    print("\n=== 타임아웃 처리 예제 ===")
+    log("\n=== 타임아웃 처리 예제 ===")
 
     try:
         # 2초 타임아웃으로 3초 작업 실행
         result = await asyncio.wait_for(simple_task("Timeout", 3.0), timeout=2.0)
-        print(f"결과: {result}")
+        log(f"결과: {result}")
     except asyncio.TimeoutError:
-        print("작업이 타임아웃되었습니다!")
+        log("작업이 타임아웃되었습니다!")
 
 
 async def main_with_cancellation():
     """작업 취소 예제"""
-    print("\n=== 작업 취소 예제 ===")
+    log("\n=== 작업 취소 예제 ===")
 
     async def long_running_task():
+        # 매 반복마다 sleep 타이머를 새로 만드는 대신,
+        # 0.5초마다 스스로 재등록되는 타이머 하나가 이벤트를 깨움
+        loop = asyncio.get_running_loop()
+        tick = asyncio.Event()
+        handle: Optional[asyncio.TimerHandle] = None
+
+        def on_tick() -> None:
+            nonlocal handle
+            tick.set()
+            handle = loop.call_later(0.5, on_tick)
+
+        handle = loop.call_later(0.5, on_tick)
         try:
             for i in range(10):
-                print(f"긴 작업 진행 중... {i+1}/10")
-                await asyncio.sleep(0.5)
+                log(f"긴 작업 진행 중... {i+1}/10")
+                await tick.wait()
+                tick.clear()
             return "긴 작업 완료"
         except asyncio.CancelledError:
-            print("작업이 취소되었습니다!")
+            log("작업이 취소되었습니다!")
             raise
+        finally:
+            handle.cancel()
 
     # 2초 후 작업 취소
     task = asyncio.create_task(long_running_task())
@@ -233,13 +319,43 @@ async def main_with_cancellation():
 
     try:
         result = await task
-        print(f"결과: {result}")
+        log(f"결과: {result}")
     except asyncio.CancelledError:
-        print("작업이 성공적으로 취소되었습니다")
+        log("작업이 성공적으로 취소되었습니다")
+
+
+async def bench_main(task_count: int = 1000) -> float:
+    """
+    코루틴 디스패치 속도 벤치마크
+
+    대기 시간이 0인 simple_task를 task_count개 만들어 모두 끝날 때까지의
+    시간을 측정합니다. 출력이 꺼진 상태(SILENT)에서 실행해야
+    스케줄러 오버헤드만 측정됩니다.
+
+    Args:
+        task_count: 생성할 태스크 수
+
+    Returns:
+        초당 완료된 태스크 수
+    """
+    start_time = time.perf_counter_ns()
+    tasks = [asyncio.create_task(simple_task("x", 0)) for _ in range(task_count)]
+    await asyncio.gather(*tasks)
+    elapsed = (time.perf_counter_ns() - start_time) / 1e9
+    return task_count / elapsed if elapsed > 0 else float("inf")
 
 
 if __name__ == "__main__":
-    print("asyncio 기초 학습을 시작합니다...\n")
+    # uvloop이 설치되어 있으면 기본 이벤트 루프 대신 사용 (Windows 미지원)
+    if uvloop is not None and sys.platform != "win32":
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    if SILENT:
+        rate = asyncio.run(bench_main())
+        print(f"simple_task 처리율: {rate:,.0f} tasks/s")
+        sys.exit(0)
+
+    log("asyncio 기초 학습을 시작합니다...\n")
 
     # 모든 예제 실행
     asyncio.run(main_basic())
@@ -249,4 +365,4 @@ if __name__ == "__main__":
     asyncio.run(main_with_timeout())
     asyncio.run(main_with_cancellation())
 
-    print("\nasyncio 기초 학습이 완료되었습니다!")
+    log("\nasyncio 기초 학습이 완료되었습니다!")
@@ -3,10 +3,22 @@
 간단한 웹소켓 서버 테스트
 """
 import asyncio
+import sys
 import websockets
-import json
+import orjson
 from datetime import datetime
 
+try:
+    import uvloop  # libuv 기반 고성능 이벤트 루프 (POSIX 전용, 선택 사항)
+except ImportError:
+    uvloop = None
+
+# 핑 응답은 모양이 고정되어 있으므로 타임스탬프만 채워 넣는 템플릿 사용
+_PONG_TEMPLATE = '{"type":"pong","timestamp":"%s"}'
+
+# 자주 오는 핑 메시지의 직렬화 형태 - 일치하면 JSON 파싱 없이 바로 응답
+_PING_MESSAGES = frozenset(['{"type":"ping"}', '{"type": "ping"}'])
+
 
 class SimpleWebSocketServer:
     def __init__(self):
@@ -21,17 +33,19 @@ class SimpleWebSocketServer:
             async for message in websocket:
                 print(f"받은 메시지: {message}")
 
+                if message in _PING_MESSAGES:
+                    await websocket.send(_PONG_TEMPLATE % datetime.now().isoformat())
+                    continue
+
                 try:
-                    data = json.loads(message)
+                    data = orjson.loads(message)
                     if data.get("type") == "ping":
-                        response = {
-                            "type": "pong",
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                        await websocket.send(json.dumps(response))
+                        await websocket.send(
+                            _PONG_TEMPLATE % datetime.now().isoformat()
+                        )
                     else:
                         await websocket.send(f"에코: {message}")
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     await websocket.send(f"에코: {message}")
 
         except websockets.exceptions.ConnectionClosed:
@@ -62,7 +76,7 @@ async def test_client():
             print(f"응답: {response}")
 
             # JSON 메시지
-            await websocket.send(json.dumps({"type": "ping"}))
+            await websocket.send(orjson.dumps({"type": "ping"}).decode())
             response = await websocket.recv()
             print(f"핑 응답: {response}")
 
@@ -93,4 +107,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop이 설치되어 있으면 기본 이벤트 루프 대신 사용 (Windows 미지원)
+    if uvloop is not None and sys.platform != "win32":
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     asyncio.run(main())
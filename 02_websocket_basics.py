@@ -8,12 +8,46 @@ import json
 import logging
 import sys
 import os
-from typing import Dict, Set, Optional, Any
+import random
+import socket
+import time
+import traceback
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+from collections import deque
 from datetime import datetime
 
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+# JSON 직렬화: orjson → ujson → 표준 json 순서로 사용 가능한 구현 선택
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    try:
+        import ujson
+
+        def _dumps(obj: Any) -> str:
+            return ujson.dumps(obj, ensure_ascii=False)
+
+        _loads = ujson.loads
+        _JSONDecodeError = ujson.JSONDecodeError
+    except ImportError:
+        # 인코더/디코더를 한 번만 만들고 바운드 메서드를 재사용
+        _dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+        _loads = json.JSONDecoder().decode
+        _JSONDecodeError = json.JSONDecodeError
+
+try:
+    import uvloop  # libuv 기반 고성능 이벤트 루프 (POSIX 전용, 선택 사항)
+except ImportError:
+    uvloop = None
+
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,72 +55,223 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 응답/브로드캐스트 메시지를 모아서 전송하기 전 대기 시간 (초)
+OUTBOX_FLUSH_DELAY = 0.002
+
+# 메시지 처리기 타입: (웹소켓, 파싱된 메시지) -> None
+MessageHandler = Callable[[Any, Dict[str, Any]], Awaitable[None]]
+
+# 연결 소켓 송신 버퍼 크기 (바이트)
+SOCKET_SNDBUF_SIZE = 262144
+
+# 핑 응답은 모양이 고정되어 있으므로 타임스탬프만 채워 넣는 템플릿 사용
+_PONG_TEMPLATE = '{"type":"pong","timestamp":"%s"}'
+
+# 자주 오는 핑 메시지의 직렬화 형태 - 일치하면 JSON 파싱 없이 바로 응답
+_PING_MESSAGES = frozenset(['{"type":"ping"}', '{"type": "ping"}'])
+
 
 class WebSocketServer:
-    """웹소켓 서버 클래스"""
+    """
+    웹소켓 서버 클래스
+
+    서버는 웹소켓 프로토콜 수준의 핑을 보내지 않습니다.
+    연결 상태를 확인하려면 클라이언트가 {"type": "ping"} 메시지를 보내야 합니다.
+    """
 
     def __init__(self, host: str = "localhost", port: int = 8000):
         self.host = host
         self.port = port
-        self.clients: Set[Any] = set()
+        # 연결 목록과 각 연결의 위치 (브로드캐스트 시 복사 없이 순회,
+        # 해제 시 마지막 원소와 자리를 바꿔 O(1)로 제거)
+        self.clients: List[Any] = []
+        self._client_index: Dict[Any, int] = {}
+        # 연결별 주소 문자열 (메시지마다 튜플을 문자열로 바꾸지 않도록 등록 시 한 번만)
+        self._client_addrs: Dict[Any, str] = {}
         self.message_count = 0
         self.ready = asyncio.Event()  # 서버 준비 상태 이벤트
+        # 보낼 메시지를 클라이언트별로 모아 두었다가 한 번에 전송
+        # 각 항목은 (단독 전송 시 프레임, 배열로 묶을 때의 JSON 요소)
+        self._pending: Dict[Any, List[Tuple[str, str]]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # 실행 중인 전송 태스크 (완료 전에 가비지 컬렉션되지 않도록 참조 유지)
+        self._flush_tasks: Set[asyncio.Task] = set()
+        # (ISO 타임스탬프 문자열, 생성 시각) - 1ms 동안 재사용
+        self._ts_cache: Tuple[str, float] = ("", 0.0)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # 메시지 타입 → 처리기 (if/elif 체인 대신 dict 조회)
+        self._handlers: Dict[str, MessageHandler] = {
+            "echo": self._handle_echo,
+            "broadcast": self._handle_broadcast,
+            "ping": self._handle_ping,
+        }
+
+    def _now_iso(self) -> str:
+        """
+        현재 시각의 ISO 문자열 반환 (1ms 단위로 캐시)
+
+        같은 1ms 구간에 처리되는 메시지들은 동일한 타임스탬프 문자열을
+        공유하므로 datetime 생성과 포맷팅 비용을 한 번만 지불합니다.
+        """
+        now = self._loop.time() if self._loop else time.monotonic()
+        if now - self._ts_cache[1] > 0.001:
+            self._ts_cache = (datetime.now().isoformat(), now)
+        return self._ts_cache[0]
+
+    @staticmethod
+    def _tune_socket(websocket: Any) -> None:
+        """
+        연결 소켓 옵션 조정
+
+        짧은 JSON 프레임이 Nagle 알고리즘 때문에 지연되지 않도록
+        TCP_NODELAY를 켜고, 송신 버퍼를 넉넉하게 잡습니다.
+        """
+        sock = websocket.transport.get_extra_info("socket")
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SNDBUF_SIZE)
+        except OSError as e:
+            logger.warning("소켓 옵션 설정 실패: %s", e)
 
     async def register_client(self, websocket: Any) -> None:
         """새 클라이언트 등록"""
-        self.clients.add(websocket)
-        logger.info(f"새 클라이언트 연결: {websocket.remote_address}")
-        logger.info(f"현재 연결된 클라이언트 수: {len(self.clients)}")
+        self._tune_socket(websocket)
+        self._client_addrs[websocket] = str(websocket.remote_address)
+        if websocket not in self._client_index:
+            self._client_index[websocket] = len(self.clients)
+            self.clients.append(websocket)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("새 클라이언트 연결: %s", self._client_addrs[websocket])
+            logger.info("현재 연결된 클라이언트 수: %d", len(self.clients))
 
     async def unregister_client(self, websocket: Any) -> None:
         """클라이언트 연결 해제"""
-        self.clients.discard(websocket)
-        logger.info(f"클라이언트 연결 해제: {websocket.remote_address}")
-        logger.info(f"현재 연결된 클라이언트 수: {len(self.clients)}")
+        index = self._client_index.pop(websocket, None)
+        if index is not None:
+            last = self.clients.pop()
+            if index < len(self.clients):
+                self.clients[index] = last
+                self._client_index[last] = index
+        client_addr = self._client_addrs.pop(websocket, None)
+        # 전송 실패로 이미 해제된 연결은 handle_client의 finally에서 다시
+        # 호출되므로, 실제로 목록에서 제거했을 때만 기록
+        if index is not None and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "클라이언트 연결 해제: %s", client_addr or websocket.remote_address
+            )
+            logger.info("현재 연결된 클라이언트 수: %d", len(self.clients))
 
     async def broadcast_message(
         self, message: str, sender: Optional[Any] = None
     ) -> None:
-        """모든 클라이언트에게 메시지 브로드캐스트"""
-        if not self.clients:
-            return
-
-        # 연결이 끊어진 클라이언트 제거
-        disconnected_clients = set()
-
-        for client in self.clients.copy():
-            try:
-                await client.send(message)
-            except ConnectionClosed:
-                disconnected_clients.add(client)
+        """
+        모든 클라이언트에게 메시지 브로드캐스트
+
+        Args:
+            message: 전송할 JSON 문자열
+            sender: 메시지를 보낸 클라이언트 (선택 사항)
+        """
+        for client in self.clients:
+            self._enqueue(client, message)
+
+    def _enqueue(self, websocket: Any, message: str, is_json: bool = True) -> None:
+        """
+        클라이언트의 송신 대기열에 메시지 추가
+
+        메시지는 바로 전송하지 않고 OUTBOX_FLUSH_DELAY 후에 한 번에 전송합니다.
+        그 사이 여러 메시지가 쌓이면 JSON 배열 하나로 합쳐서 보냅니다.
+
+        Args:
+            websocket: 받을 클라이언트
+            message: 전송할 문자열
+            is_json: message가 JSON 문자열인지 여부 (아니면 배열에 문자열로 포함)
+        """
+        element = message if is_json else _dumps(message)
+        self._pending.setdefault(websocket, []).append((message, element))
+
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(
+                OUTBOX_FLUSH_DELAY, self._schedule_flush
+            )
 
-        # 끊어진 연결 제거
-        for client in disconnected_clients:
-            await self.unregister_client(client)
+    def _schedule_flush(self) -> None:
+        """타이머 콜백: 대기 중인 메시지를 꺼내 전송 태스크를 시작"""
+        self._flush_handle = None
+        batched, self._pending = self._pending, {}
+        task = asyncio.create_task(self._flush(batched))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batched: Dict[Any, List[Tuple[str, str]]]) -> None:
+        """클라이언트별로 모인 메시지를 프레임 하나로 합쳐 동시에 전송"""
+        # 대기하는 동안 연결이 끊어진 클라이언트는 건너뜀
+        targets = tuple(client for client in batched if client in self._client_index)
+
+        # 브로드캐스트만 받은 클라이언트들은 대기열 내용이 같으므로
+        # 같은 내용의 프레임은 한 번만 만들고 UTF-8 인코딩도 한 번만 수행해
+        # 모든 수신자가 같은 bytes 버퍼를 공유
+        frames: Dict[Tuple[str, ...], bytes] = {}
+        encoded: Dict[str, bytes] = {}
+        payloads: List[bytes] = []
+        for client in targets:
+            messages = batched[client]
+            if len(messages) == 1:
+                message = messages[0][0]
+                data = encoded.get(message)
+                if data is None:
+                    data = encoded[message] = message.encode()
+                payloads.append(data)
+                continue
+            key = tuple(element for _, element in messages)
+            frame = frames.get(key)
+            if frame is None:
+                frame = frames[key] = ("[" + ",".join(key) + "]").encode()
+            payloads.append(frame)
+
+        # text=True: 미리 인코딩한 bytes를 바이너리가 아닌 텍스트 프레임으로 전송
+        results = await asyncio.gather(
+            *(
+                client.send(payload, text=True)
+                for client, payload in zip(targets, payloads)
+            ),
+            return_exceptions=True,
+        )
+
+        # 끊어진 연결은 제거하고, 그 밖의 전송 오류는 기록
+        for client, result in zip(targets, results):
+            if isinstance(result, ConnectionClosed):
+                await self.unregister_client(client)
+            elif isinstance(result, Exception):
+                logger.error(
+                    "❌ 메시지 전송 중 오류 (클라이언트: %s): %r",
+                    self._client_addrs.get(client),
+                    result,
+                )
 
     async def handle_client(self, websocket: Any) -> None:
         """클라이언트 연결 처리"""
-        client_addr = websocket.remote_address
         await self.register_client(websocket)
+        client_addr = self._client_addrs[websocket]
 
         try:
             async for message in websocket:
                 try:
                     await self.process_message(websocket, message)
                 except Exception as e:
+                    # 메시지 처리 오류가 전체 연결을 끊지 않도록 함
                     logger.error(
-                        f"❌ 메시지 처리 중 오류 (클라이언트: {client_addr}): {e}"
+                        "❌ 메시지 처리 중 오류 (클라이언트: %s): %s", client_addr, e
                     )
-                    # 메시지 처리 오류가 전체 연결을 끊지 않도록 함
         except ConnectionClosed:
-            logger.info(f"클라이언트 연결 정상 종료: {client_addr}")
+            logger.info("클라이언트 연결 정상 종료: %s", client_addr)
         except Exception as e:
             logger.error(
-                f"❌ 클라이언트 처리 중 심각한 오류 (클라이언트: {client_addr}): {e}"
+                "❌ 클라이언트 처리 중 심각한 오류 (클라이언트: %s): %s", client_addr, e
             )
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.error("%s", traceback.format_exc())
         finally:
             await self.unregister_client(websocket)
 
@@ -94,60 +279,70 @@ class WebSocketServer:
         """메시지 처리"""
         self.message_count += 1
 
+        if message in _PING_MESSAGES:
+            self._enqueue(websocket, _PONG_TEMPLATE % self._now_iso())
+            return
+
+        # JSON 객체가 아닌 메시지는 파서를 거치지 않고 바로 일반 텍스트로 처리
+        # (바이너리 프레임은 bytes로 오므로 str과 bytes를 모두 비교)
+        if message[:1] not in ("{", b"{"):
+            self._reply_text(websocket, message)
+            return
+
         try:
-            # JSON 메시지 파싱 시도
-            data = json.loads(message)
-            message_type = data.get("type", "unknown")
-
-            if message_type == "echo":
-                # 에코 메시지
-                response = {
-                    "type": "echo_response",
-                    "original_message": data.get("message", ""),
-                    "timestamp": datetime.now().isoformat(),
-                    "server_message_count": self.message_count,
-                }
-                await websocket.send(json.dumps(response, ensure_ascii=False))
-
-            elif message_type == "broadcast":
-                # 브로드캐스트 메시지
-                broadcast_data = {
-                    "type": "broadcast",
-                    "message": data.get("message", ""),
-                    "sender": str(websocket.remote_address),
-                    "timestamp": datetime.now().isoformat(),
-                }
-                await self.broadcast_message(
-                    json.dumps(broadcast_data, ensure_ascii=False), websocket
-                )
+            data = _loads(message)
+        except _JSONDecodeError:
+            # '{'로 시작하지만 JSON이 아닌 일반 텍스트 메시지
+            self._reply_text(websocket, message)
+            return
 
-            elif message_type == "ping":
-                # 핑 메시지
-                pong_response = {
-                    "type": "pong",
-                    "timestamp": datetime.now().isoformat(),
-                }
-                await websocket.send(json.dumps(pong_response, ensure_ascii=False))
+        # 메시지 타입별 처리기를 테이블에서 한 번에 조회
+        handler = self._handlers.get(data.get("type", "unknown"), self._handle_unknown)
+        await handler(websocket, data)
+
+    def _reply_text(self, websocket: Any, message: str) -> None:
+        """일반 텍스트 메시지에 대한 응답"""
+        response = f"서버가 받은 메시지: {message} (메시지 번호: {self.message_count})"
+        self._enqueue(websocket, response, is_json=False)
+
+    async def _handle_echo(self, websocket: Any, data: Dict[str, Any]) -> None:
+        """에코 메시지"""
+        response = {
+            "type": "echo_response",
+            "original_message": data.get("message", ""),
+            "timestamp": self._now_iso(),
+            "server_message_count": self.message_count,
+        }
+        self._enqueue(websocket, _dumps(response))
 
-            else:
-                # 알 수 없는 메시지 타입
-                error_response = {
-                    "type": "error",
-                    "message": f"알 수 없는 메시지 타입: {message_type}",
-                    "timestamp": datetime.now().isoformat(),
-                }
-                await websocket.send(json.dumps(error_response, ensure_ascii=False))
-
-        except json.JSONDecodeError:
-            # JSON이 아닌 일반 텍스트 메시지
-            response = (
-                f"서버가 받은 메시지: {message} (메시지 번호: {self.message_count})"
-            )
-            await websocket.send(response)
+    async def _handle_broadcast(self, websocket: Any, data: Dict[str, Any]) -> None:
+        """브로드캐스트 메시지"""
+        broadcast_data = {
+            "type": "broadcast",
+            "message": data.get("message", ""),
+            "sender": self._client_addrs[websocket],
+            "timestamp": self._now_iso(),
+        }
+        await self.broadcast_message(_dumps(broadcast_data), websocket)
+
+    async def _handle_ping(self, websocket: Any, data: Dict[str, Any]) -> None:
+        """핑 메시지 - dict 생성과 직렬화 없이 템플릿으로 응답"""
+        self._enqueue(websocket, _PONG_TEMPLATE % self._now_iso())
+
+    async def _handle_unknown(self, websocket: Any, data: Dict[str, Any]) -> None:
+        """알 수 없는 메시지 타입"""
+        error_response = {
+            "type": "error",
+            "message": f"알 수 없는 메시지 타입: {data.get('type', 'unknown')}",
+            "timestamp": self._now_iso(),
+        }
+        self._enqueue(websocket, _dumps(error_response))
 
     async def start_server(self) -> None:
         """서버 시작"""
-        logger.info(f"웹소켓 서버 시작 시도: ws://{self.host}:{self.port}")
+        logger.info("웹소켓 서버 시작 시도: ws://%s:%s", self.host, self.port)
+        self._loop = asyncio.get_running_loop()
+        logger.info("이벤트 루프: %s", type(self._loop).__module__)
 
         async def handler(websocket):
             await self.handle_client(websocket)
@@ -157,17 +352,23 @@ class WebSocketServer:
                 handler,
                 self.host,
                 self.port,
-                ping_interval=20,  # 20초마다 핑 전송
-                ping_timeout=10,  # 10초 내 핑 응답 없으면 연결 종료
+                # 라이브러리 수준 핑은 연결마다 타이머를 만들므로 끄고,
+                # 생존 확인은 클라이언트의 {"type": "ping"} 메시지로 처리
+                ping_interval=None,
+                ping_timeout=None,
                 close_timeout=10,  # 연결 종료 타임아웃
+                max_size=2**20,  # 최대 메시지 크기 (1 MiB)
+                max_queue=64,  # 연결당 수신 대기열 최대 메시지 수
+                write_limit=2**16,  # 송신 버퍼 상한 (64 KiB, 초과 시 send가 대기)
+                compression=None,  # 짧은 JSON 프레임은 압축 이득보다 CPU 비용이 큼
             ):
                 logger.info(
-                    f"✅ 서버가 성공적으로 시작됨: ws://{self.host}:{self.port}"
+                    "✅ 서버가 성공적으로 시작됨: ws://%s:%s", self.host, self.port
                 )
                 self.ready.set()  # 서버 준비 완료 신호
                 await asyncio.Future()  # 서버를 계속 실행
         except Exception as e:
-            logger.error(f"❌ 서버 시작 실패: {e}")
+            logger.error("❌ 서버 시작 실패: %s", e)
             raise
 
 
@@ -177,26 +378,60 @@ class WebSocketClient:
     def __init__(self, uri: str):
         self.uri = uri
         self.websocket: Optional[Any] = None
+        # 배열로 묶여 도착한 메시지 중 아직 꺼내지 않은 메시지
+        self._inbox: Deque[str] = deque()
 
-    async def connect(self, max_retries: int = 3, retry_delay: float = 1.0) -> None:
-        """서버에 연결 (재시도 로직 포함)"""
+    def _unpack(self, frame: str) -> List[str]:
+        """서버가 여러 메시지를 JSON 배열 하나로 묶어 보낸 경우 개별 메시지로 분리"""
+        if not frame.startswith("["):
+            return [frame]
+        try:
+            items = _loads(frame)
+        except _JSONDecodeError:
+            return [frame]
+        return [item if isinstance(item, str) else _dumps(item) for item in items]
+
+    async def connect(
+        self,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        open_timeout: float = 2.0,
+    ) -> None:
+        """
+        서버에 연결 (재시도 로직 포함)
+
+        연결 시도마다 open_timeout으로 제한하고, 재시도 간격은 지수적으로
+        늘리되 약간의 무작위 지연(jitter)을 더해 동시에 재접속이 몰리지 않게 합니다.
+        """
         last_error = None
 
         for attempt in range(1, max_retries + 1):
             try:
-                logger.info(f"서버 연결 시도 {attempt}/{max_retries}: {self.uri}")
-                self.websocket = await websockets.connect(self.uri)
-                logger.info(f"✅ 서버에 연결됨: {self.uri}")
+                logger.info("서버 연결 시도 %d/%d: %s", attempt, max_retries, self.uri)
+                # 서버와 마찬가지로 짧은 프레임에는 압축을 사용하지 않고,
+                # 수신 대기열과 메시지 크기를 제한해 연결당 메모리를 묶어 둠
+                self.websocket = await websockets.connect(
+                    self.uri,
+                    open_timeout=open_timeout,
+                    ping_interval=20,
+                    ping_timeout=10,
+                    max_size=2**20,
+                    max_queue=32,
+                    compression=None,
+                )
+                logger.info("✅ 서버에 연결됨: %s", self.uri)
                 return
             except Exception as e:
                 last_error = e
-                logger.warning(f"⚠️  연결 실패 (시도 {attempt}/{max_retries}): {e}")
+                logger.warning("⚠️  연결 실패 (시도 %d/%d): %s", attempt, max_retries, e)
 
                 if attempt < max_retries:
-                    logger.info(f"   {retry_delay}초 후 재시도...")
-                    await asyncio.sleep(retry_delay)
+                    delay = min(retry_delay * (2 ** (attempt - 1)), 10.0)
+                    delay += random.uniform(0, 0.1)
+                    logger.info("   %.2f초 후 재시도...", delay)
+                    await asyncio.sleep(delay)
 
-        logger.error(f"❌ 서버 연결 실패 (모든 재시도 소진): {last_error}")
+        logger.error("❌ 서버 연결 실패 (모든 재시도 소진): %s", last_error)
         raise last_error if last_error else RuntimeError("연결 실패")
 
     async def disconnect(self) -> None:
@@ -211,18 +446,12 @@ class WebSocketClient:
             raise RuntimeError("서버에 연결되지 않았습니다")
 
         await self.websocket.send(message)
-        # JSON 문자열인 경우 예쁘게 포맷팅하여 로그 출력
-        try:
-            data = json.loads(message)
-            logger.info(
-                f"메시지 전송: {json.dumps(data, ensure_ascii=False, indent=2)}"
-            )
-        except (json.JSONDecodeError, TypeError):
-            logger.info(f"메시지 전송: {message}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("메시지 전송: %s", message)
 
     async def send_json(self, data: dict) -> None:
         """JSON 메시지 전송"""
-        message = json.dumps(data, ensure_ascii=False)
+        message = _dumps(data)
         await self.send_message(message)
 
     async def receive_message(self) -> str:
@@ -230,36 +459,56 @@ class WebSocketClient:
         if not self.websocket:
             raise RuntimeError("서버에 연결되지 않았습니다")
 
-        message = await self.websocket.recv()
-        # JSON 문자열인 경우 예쁘게 포맷팅하여 로그 출력
-        try:
-            data = json.loads(message)
-            logger.info(
-                f"메시지 수신: {json.dumps(data, ensure_ascii=False, indent=2)}"
-            )
-        except (json.JSONDecodeError, TypeError):
-            logger.info(f"메시지 수신: {message}")
+        if not self._inbox:
+            self._inbox.extend(self._unpack(await self.websocket.recv()))
+        message = self._inbox.popleft()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("메시지 수신: %s", message)
         return message
 
+    async def receive_n(self, n: int, timeout: float) -> List[str]:
+        """
+        메시지 n개를 하나의 타임아웃 안에서 수신
+
+        메시지마다 타임아웃을 거는 대신 전체 수신에 타이머 하나만 사용하고,
+        도착한 순서대로 꺼냅니다. 하나의 연결에서 recv()를 동시에 여러 번
+        호출할 수 없으므로 as_completed로 수신 태스크를 띄우는 대신
+        같은 태스크 안에서 연속으로 수신합니다.
+
+        Args:
+            n: 수신할 메시지 수
+            timeout: 전체 수신 타임아웃 (초)
+
+        Returns:
+            수신한 메시지 목록 (타임아웃 시 n개보다 적을 수 있음)
+        """
+        received: List[str] = []
+        try:
+            # 별도 태스크를 만들지 않고 현재 태스크에 마감 시각만 설정
+            async with asyncio.timeout(timeout):
+                while len(received) < n:
+                    received.append(await self.receive_message())
+        except TimeoutError:
+            pass
+        return received
+
     async def listen_for_messages(self) -> None:
         """메시지 수신 대기"""
         if not self.websocket:
             raise RuntimeError("서버에 연결되지 않았습니다")
 
+        # 로그 레벨 확인은 루프 밖에서 한 번만 수행
+        log_messages = logger.isEnabledFor(logging.INFO)
         try:
-            async for message in self.websocket:
-                # JSON 문자열인 경우 예쁘게 포맷팅하여 로그 출력
-                try:
-                    data = json.loads(message)
-                    logger.info(
-                        f"수신된 메시지: {json.dumps(data, ensure_ascii=False, indent=2)}"
-                    )
-                except (json.JSONDecodeError, TypeError):
-                    logger.info(f"수신된 메시지: {message}")
+            async for frame in self.websocket:
+                if not log_messages:
+                    continue
+                for message in self._unpack(frame):
+                    logger.info("수신된 메시지: %s", message)
         except ConnectionClosed:
             logger.info("서버 연결이 종료되었습니다")
         except Exception as e:
-            logger.error(f"메시지 수신 중 오류: {e}")
+            logger.error("메시지 수신 중 오류: %s", e)
 
 
 async def demo_client_interactions():
@@ -270,45 +519,33 @@ async def demo_client_interactions():
         logger.info("📱 단일 클라이언트 데모 시작")
         await client.connect()
 
-        # 1. 일반 텍스트 메시지 전송
-        logger.info("1️⃣  일반 텍스트 메시지 전송")
-        await client.send_message("안녕하세요, 서버!")
-
-        # 2. JSON 메시지 전송 (에코)
-        logger.info("2️⃣  에코 메시지 전송")
+        # 하나의 연결에서 4개의 메시지를 응답을 기다리지 않고 연속 전송 (파이프라이닝)
+        logger.info("📤 텍스트 / 에코 / 핑 / 브로드캐스트 메시지 연속 전송")
         echo_data = {"type": "echo", "message": "이 메시지를 에코해주세요"}
-        await client.send_json(echo_data)
-
-        # 3. 핑 메시지 전송
-        logger.info("3️⃣  핑 메시지 전송")
         ping_data = {"type": "ping"}
-        await client.send_json(ping_data)
-
-        # 4. 브로드캐스트 메시지 전송
-        logger.info("4️⃣  브로드캐스트 메시지 전송")
         broadcast_data = {
             "type": "broadcast",
             "message": "모든 클라이언트에게 전송되는 메시지입니다",
         }
-        await client.send_json(broadcast_data)
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(client.send_message("안녕하세요, 서버!"))
+            tg.create_task(client.send_json(echo_data))
+            tg.create_task(client.send_json(ping_data))
+            tg.create_task(client.send_json(broadcast_data))
 
         # 응답 수신
         logger.info("📥 응답 수신 대기 중...")
-        for i in range(4):
-            try:
-                response = await asyncio.wait_for(client.receive_message(), timeout=2.0)
-                print(f"   응답 {i+1}: {response}")
-            except asyncio.TimeoutError:
-                logger.warning(f"⏱️  응답 {i+1} 타임아웃")
-                break
+        responses = await client.receive_n(4, timeout=2.0)
+        for i, response in enumerate(responses, 1):
+            print(f"   응답 {i}: {response}")
+        if len(responses) < 4:
+            logger.warning("⏱️  응답 %d 타임아웃", len(responses) + 1)
 
         logger.info("✅ 단일 클라이언트 데모 완료")
 
     except Exception as e:
-        logger.error(f"❌ 클라이언트 데모 오류: {e}")
-        import traceback
-
-        logger.error(traceback.format_exc())
+        logger.error("❌ 클라이언트 데모 오류: %s", e)
+        logger.error("%s", traceback.format_exc())
         raise
     finally:
         await client.disconnect()
@@ -316,51 +553,59 @@ async def demo_client_interactions():
 
 async def demo_multiple_clients():
     """여러 클라이언트 데모"""
-    clients = []
+    clients = [WebSocketClient("ws://localhost:8000") for _ in range(3)]
+
+    async def spawn(index: int, client: WebSocketClient) -> None:
+        # 연결이 끝난 클라이언트는 다른 클라이언트의 핸드셰이크를 기다리지 않고
+        # 바로 브로드캐스트 메시지를 전송
+        await client.connect()
+        await client.send_json(
+            {"type": "broadcast", "message": f"클라이언트 {index}에서 전송한 메시지"}
+        )
+
+    async def receive_with_timeout(client: WebSocketClient) -> Optional[str]:
+        try:
+            return await asyncio.wait_for(client.receive_message(), timeout=1.0)
+        except asyncio.TimeoutError:
+            return None
 
     try:
         logger.info("👥 다중 클라이언트 데모 시작")
 
-        # 3개의 클라이언트 생성
-        for i in range(3):
-            logger.info(f"🔌 클라이언트 {i+1} 연결 중...")
-            client = WebSocketClient(f"ws://localhost:8000")
-            await client.connect()
-            clients.append(client)
-            logger.info(f"✅ 클라이언트 {i+1} 연결됨")
-
-            # 각 클라이언트가 브로드캐스트 메시지 전송
-            broadcast_data = {
-                "type": "broadcast",
-                "message": f"클라이언트 {i+1}에서 전송한 메시지",
-            }
-            await client.send_json(broadcast_data)
-
-            # 잠시 대기
-            await asyncio.sleep(0.5)
-
-        # 모든 클라이언트의 응답 수신
+        # 3개의 클라이언트가 동시에 연결하고 각자 브로드캐스트 메시지를 전송
+        # (순차 연결·전송 시 N·RTT → 약 1·RTT)
+        logger.info("🔌 클라이언트 %d개 동시 연결 및 전송 중...", len(clients))
+        async with asyncio.TaskGroup() as tg:
+            for i, client in enumerate(clients, 1):
+                tg.create_task(spawn(i, client))
+        logger.info("✅ 모든 클라이언트 연결됨")
+
+        # 모든 클라이언트의 응답을 동시에 수신
         logger.info("📥 모든 클라이언트의 응답 수신 중...")
-        for idx, client in enumerate(clients, 1):
-            try:
-                response = await asyncio.wait_for(client.receive_message(), timeout=1.0)
+        async with asyncio.TaskGroup() as tg:
+            receive_tasks = [
+                tg.create_task(receive_with_timeout(client)) for client in clients
+            ]
+
+        for idx, task in enumerate(receive_tasks, 1):
+            response = task.result()
+            if response is None:
+                logger.warning("⏱️  클라이언트 %d 응답 타임아웃", idx)
+            else:
                 print(f"   클라이언트 {idx} 응답: {response}")
-            except asyncio.TimeoutError:
-                logger.warning(f"⏱️  클라이언트 {idx} 응답 타임아웃")
 
         logger.info("✅ 다중 클라이언트 데모 완료")
 
     except Exception as e:
-        logger.error(f"❌ 다중 클라이언트 데모 오류: {e}")
-        import traceback
-
-        logger.error(traceback.format_exc())
+        logger.error("❌ 다중 클라이언트 데모 오류: %s", e)
+        logger.error("%s", traceback.format_exc())
         raise
     finally:
         # 모든 클라이언트 연결 해제
         logger.info("🔌 모든 클라이언트 연결 해제 중...")
-        for client in clients:
-            await client.disconnect()
+        await asyncio.gather(
+            *(client.disconnect() for client in clients), return_exceptions=True
+        )
 
 
 async def main():
@@ -390,7 +635,7 @@ async def main():
         if server_task.done():
             logger.error("❌ 서버 태스크가 예기치 않게 종료됨!")
             if server_task.exception():
-                logger.error(f"   예외: {server_task.exception()}")
+                logger.error("   예외: %s", server_task.exception())
             return False
         return True
 
@@ -421,4 +666,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop이 설치되어 있으면 기본 이벤트 루프 대신 사용 (Windows 미지원)
+    if uvloop is not None and sys.platform != "win32":
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     asyncio.run(main())
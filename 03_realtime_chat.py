@@ -6,28 +6,109 @@ asyncio와 웹소켓을 결합한 실전 예제
 import asyncio
 import json
 import logging
-import uuid
-from datetime import datetime
-from typing import Dict, Set, Optional, List
-from dataclasses import dataclass, asdict
+import queue
+import sys
+import threading
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from itertools import islice
+from os import urandom
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, List, Union
+from dataclasses import dataclass, field
 from enum import Enum
 
+import orjson
+
 try:
     import websockets
-    from websockets.server import WebSocketServerProtocol
+    from websockets.asyncio.client import ClientConnection
+    from websockets.asyncio.server import ServerConnection
     from websockets.exceptions import ConnectionClosed
 except ImportError:
     print("websockets 라이브러리가 설치되지 않았습니다.")
     print("다음 명령어로 설치하세요: pip install websockets")
     exit(1)
 
+try:
+    import uvloop  # libuv 기반 고성능 이벤트 루프 (POSIX 전용, 선택 사항)
+except ImportError:
+    uvloop = None
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 사용자별 송신 대기열 크기 - 가득 차면 느린 클라이언트로 보고 연결을 끊음
+OUT_QUEUE_SIZE = 256
+
+# 채팅방 전체에서 동시에 진행할 수 있는 소켓 전송 수
+MAX_CONCURRENT_SENDS = 256
+
+# 채팅 메시지를 모아 한 번에 브로드캐스트하기까지 기다리는 시간 (초)
+CHAT_FLUSH_DELAY = 0.005
+
+# 내용이 고정된 메시지는 모듈 로드 시 한 번만 직렬화
+_USERNAME_REQUEST = orjson.dumps(
+    {"type": "request_username", "message": "사용자명을 입력하세요:"}
+)
+# 하트비트 응답은 타임스탬프만 바뀌므로 앞뒤 bytes를 미리 만들어 이어 붙임
+_HEARTBEAT_PREFIX = b'{"type":"heartbeat_response","timestamp":"'
+_HEARTBEAT_SUFFIX = b'"}'
+
+
+class StdinReader:
+    """
+    표준 입력 전용 스레드
+
+    입력마다 기본 실행기(executor)에 작업을 넘기는 대신, 계속 살아 있는
+    스레드 하나가 요청이 올 때마다 한 줄을 읽어 이벤트 루프로 돌려줍니다.
+    요청이 있을 때만 읽으므로 종료 시 입력을 붙잡고 있는 스레드가 남지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._requests: "queue.SimpleQueue[Optional[asyncio.Future]]" = (
+            queue.SimpleQueue()
+        )
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self) -> None:
+        while True:
+            future = self._requests.get()
+            if future is None:
+                return
+            try:
+                line: Optional[str] = input()
+            except EOFError:
+                line = None
+            try:
+                self._loop.call_soon_threadsafe(self._deliver, future, line)
+            except RuntimeError:  # 이벤트 루프가 이미 닫힘
+                return
+
+    @staticmethod
+    def _deliver(future: asyncio.Future, line: Optional[str]) -> None:
+        if not future.done():
+            future.set_result(line)
+
+    async def readline(self) -> Optional[str]:
+        """한 줄 읽기 (입력이 끝나면 None)"""
+        future = self._loop.create_future()
+        self._requests.put(future)
+        return await future
+
+    def close(self) -> None:
+        """입력 스레드 종료"""
+        self._requests.put(None)
+
+
+def _new_id() -> str:
+    """128비트 무작위 ID (UUID 객체를 만들지 않고 바로 16진수 문자열 생성)"""
+    return urandom(16).hex()
+
 
-class MessageType(Enum):
-    """메시지 타입 열거형"""
+class MessageType(str, Enum):
+    """메시지 타입 열거형 (str 상속 - 멤버 자체가 JSON 문자열로 직렬화됨)"""
 
     JOIN = "join"
     LEAVE = "leave"
@@ -37,26 +118,47 @@ class MessageType(Enum):
     HEARTBEAT = "heartbeat"
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """사용자 정보"""
 
     id: str
     username: str
-    websocket: WebSocketServerProtocol
+    websocket: ServerConnection
     joined_at: datetime
-    last_activity: datetime
+    # 마지막 활동 시각 - 이벤트 루프의 단조 시계 값 (loop.time())
+    last_activity_mono: float
+    # 이 사용자에게 보낼 메시지 대기열과 이를 비우는 전송 태스크
+    out_queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=OUT_QUEUE_SIZE)
+    )
+    writer_task: Optional[asyncio.Task] = None
+    # 입장 시각은 바뀌지 않으므로 ISO 문자열을 한 번만 만들어 둠
+    joined_iso: str = field(init=False, repr=False)
+    joined_mono: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.joined_iso = self.joined_at.isoformat()
+        self.joined_mono = self.last_activity_mono
+
+    def touch(self) -> None:
+        """활동 시각 갱신 (datetime 객체를 만들지 않고 단조 시계만 읽음)"""
+        self.last_activity_mono = asyncio.get_running_loop().time()
 
     def to_dict(self) -> dict:
         return {
             "id": self.id,
             "username": self.username,
-            "joined_at": self.joined_at.isoformat(),
-            "last_activity": self.last_activity.isoformat(),
+            "joined_at": self.joined_iso,
+            # 표시용 벽시계 시각은 입장 시각 기준 경과 시간으로 필요할 때만 계산
+            "last_activity": (
+                self.joined_at
+                + timedelta(seconds=self.last_activity_mono - self.joined_mono)
+            ).isoformat(),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """채팅 메시지"""
 
@@ -74,7 +176,7 @@ class ChatMessage:
             "username": self.username,
             "message": self.message,
             "timestamp": self.timestamp.isoformat(),
-            "type": self.message_type.value,
+            "type": self.message_type,
         }
 
 
@@ -83,13 +185,25 @@ class ChatRoom:
 
     def __init__(self, room_id: str = "general"):
         self.room_id = room_id
-        self.users: Dict[str, User] = {}
-        self.message_history: List[ChatMessage] = []
+        # 활동 순서로 정렬된 사용자 목록 (가장 오래 활동이 없던 사용자가 맨 앞)
+        self.users: "OrderedDict[str, User]" = OrderedDict()
         self.max_history = 100  # 최대 메시지 히스토리 수
-
-    async def add_user(self, websocket: WebSocketServerProtocol, username: str) -> User:
+        # 가득 차면 가장 오래된 메시지가 O(1)로 밀려나는 링 버퍼
+        self.message_history: Deque[ChatMessage] = deque(maxlen=self.max_history)
+        self.send_timeout = 5.0  # 클라이언트별 전송 타임아웃 (초)
+        # 사용자가 많을 때 동시에 진행 중인 전송(프레임 버퍼) 수를 제한
+        self._send_sem = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        # 아직 브로드캐스트하지 않은 채팅 메시지와 전송 예약 타이머
+        self._pending: List[dict] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # 입장/퇴장 때만 증가하는 멤버십 버전과 그 버전으로 직렬화한 사용자 목록
+        self._users_version = 0
+        self._user_list_version = -1
+        self._user_list_data = b""
+
+    async def add_user(self, websocket: ServerConnection, username: str) -> User:
         """사용자 추가"""
-        user_id = str(uuid.uuid4())
+        user_id = _new_id()
         now = datetime.now()
 
         user = User(
@@ -97,14 +211,16 @@ class ChatRoom:
             username=username,
             websocket=websocket,
             joined_at=now,
-            last_activity=now,
+            last_activity_mono=asyncio.get_running_loop().time(),
         )
 
         self.users[user_id] = user
+        self._users_version += 1
+        user.writer_task = asyncio.create_task(self._writer_loop(user))
 
         # 입장 메시지 생성
         join_message = ChatMessage(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             user_id="system",
             username="System",
             message=f"{username}님이 입장했습니다.",
@@ -120,24 +236,53 @@ class ChatRoom:
 
     async def remove_user(self, user_id: str) -> None:
         """사용자 제거"""
-        if user_id in self.users:
-            user = self.users[user_id]
-            del self.users[user_id]
-
-            # 퇴장 메시지 생성
-            leave_message = ChatMessage(
-                id=str(uuid.uuid4()),
-                user_id="system",
-                username="System",
-                message=f"{user.username}님이 퇴장했습니다.",
-                timestamp=datetime.now(),
-                message_type=MessageType.LEAVE,
-            )
+        await self.remove_users([user_id])
+
+    async def remove_users(self, user_ids: List[str]) -> None:
+        """
+        여러 사용자를 한 번에 제거
+
+        동시에 끊어진 사용자가 여러 명이어도 퇴장 메시지와 사용자 목록은
+        한 번씩만 브로드캐스트합니다.
+        """
+        removed = [
+            user
+            for user in map(self._remove_user_state, user_ids)
+            if user is not None
+        ]
+        if not removed:
+            return
 
-            await self.broadcast_message(leave_message)
-            await self.send_user_list()
+        await self._announce_leave([user.username for user in removed])
 
-            logger.info(f"사용자 제거: {user.username} (ID: {user_id})")
+        for user in removed:
+            logger.info(f"사용자 제거: {user.username} (ID: {user.id})")
+
+    def _remove_user_state(self, user_id: str) -> Optional[User]:
+        """사용자를 목록에서 빼고 전송 태스크를 정리 (브로드캐스트 없음)"""
+        user = self.users.pop(user_id, None)
+        if user is None:
+            return None
+        self._users_version += 1
+
+        # 전송 태스크 정리 (전송 태스크 자신이 호출한 경우는 스스로 종료됨)
+        if user.writer_task and user.writer_task is not asyncio.current_task():
+            user.writer_task.cancel()
+        return user
+
+    async def _announce_leave(self, usernames: List[str]) -> None:
+        """퇴장 메시지와 갱신된 사용자 목록을 한 번씩 브로드캐스트"""
+        leave_message = ChatMessage(
+            id=_new_id(),
+            user_id="system",
+            username="System",
+            message=f"{', '.join(usernames)}님이 퇴장했습니다.",
+            timestamp=datetime.now(),
+            message_type=MessageType.LEAVE,
+        )
+
+        await self.broadcast_message(leave_message)
+        await self.send_user_list()
 
     async def send_message(self, user_id: str, message: str) -> None:
         """메시지 전송"""
@@ -145,69 +290,173 @@ class ChatRoom:
             return
 
         user = self.users[user_id]
-        user.last_activity = datetime.now()
+        self.touch_user(user)
+        now = datetime.now()
 
         # 채팅 메시지 생성
-        chat_message = ChatMessage(
-            id=str(uuid.uuid4()),
-            user_id=user_id,
-            username=user.username,
-            message=message,
-            timestamp=datetime.now(),
-        )
+        history = self.message_history
+        if len(history) == history.maxlen:
+            # 히스토리가 가득 차 있으면 밀려날 가장 오래된 메시지 객체를 재사용
+            # (브로드캐스트 대기열에는 dict로 변환해 넣으므로 히스토리 밖에서
+            # 참조되지 않음)
+            chat_message = history.popleft()
+            chat_message.id = _new_id()
+            chat_message.user_id = user_id
+            chat_message.username = user.username
+            chat_message.message = message
+            chat_message.timestamp = now
+            chat_message.message_type = MessageType.MESSAGE
+        else:
+            chat_message = ChatMessage(
+                id=_new_id(),
+                user_id=user_id,
+                username=user.username,
+                message=message,
+                timestamp=now,
+            )
 
         # 메시지 히스토리에 추가
-        self.message_history.append(chat_message)
-        if len(self.message_history) > self.max_history:
-            self.message_history.pop(0)
+        history.append(chat_message)
+
+        # 바로 브로드캐스트하지 않고 CHAT_FLUSH_DELAY 동안 모아서 한 번에 전송
+        self._pending.append(chat_message.to_dict())
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                CHAT_FLUSH_DELAY, self._flush_pending
+            )
+
+    def touch_user(self, user: User) -> None:
+        """사용자 활동 시각을 갱신하고 활동 순서의 맨 뒤로 이동"""
+        if user.id in self.users:
+            user.touch()
+            self.users.move_to_end(user.id)
+
+    def _flush_pending(self) -> None:
+        """
+        모아 둔 채팅 메시지를 브로드캐스트
+
+        메시지가 하나면 그대로, 여러 개면 "messages_batch" 메시지 하나로
+        묶어 보내므로 메시지 수와 관계없이 전송 횟수가 일정하게 유지됩니다.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
 
-        # 모든 사용자에게 브로드캐스트
-        await self.broadcast_message(chat_message)
+        pending, self._pending = self._pending, []
+        if len(pending) == 1:
+            message_data = orjson.dumps(pending[0])
+        else:
+            message_data = orjson.dumps(
+                {
+                    "type": "messages_batch",
+                    "messages": pending,
+                    "timestamp": datetime.now().isoformat(),
+                }
+            )
+        # 대기열이 가득 찬 사용자는 연결이 끊기고 handle_client에서 정리됨
+        self._enqueue_all(message_data, "메시지")
 
     async def broadcast_message(self, message: ChatMessage) -> None:
         """메시지 브로드캐스트"""
         if not self.users:
             return
 
-        message_data = json.dumps(message.to_dict())
-        disconnected_users = []
+        # 한 번만 직렬화한 UTF-8 bytes를 모든 수신자가 공유
+        message_data = orjson.dumps(message.to_dict())
+        await self._send_to_all(message_data, "메시지")
+
+    async def send_user_list(self) -> None:
+        """
+        사용자 목록 전송
+
+        직렬화 결과는 멤버십이 바뀔 때(입장/퇴장)만 다시 만들고, 그 사이의
+        요청에는 캐시된 bytes를 그대로 보냅니다. 따라서 목록의 timestamp와
+        last_activity는 마지막으로 멤버십이 바뀐 시점 기준입니다.
+        """
+        if self._user_list_version != self._users_version:
+            user_list_data = {
+                "type": MessageType.USER_LIST,
+                "users": [user.to_dict() for user in self.users.values()],
+                "timestamp": datetime.now().isoformat(),
+            }
+            self._user_list_data = orjson.dumps(user_list_data)
+            self._user_list_version = self._users_version
+
+        await self._send_to_all(self._user_list_data, "사용자 목록")
+
+    async def _send_to_all(self, message_data: bytes, label: str) -> None:
+        """
+        모든 사용자의 송신 대기열에 메시지 추가
+
+        실제 전송은 사용자별 전송 태스크가 담당하므로, 느린 클라이언트가
+        브로드캐스트하는 쪽이나 다른 사용자의 수신을 지연시키지 않습니다.
+        대기열이 가득 찬 사용자는 따라오지 못하는 것으로 보고 제거합니다.
+        """
+        # 먼저 보낸 채팅 메시지가 뒤로 밀리지 않도록 모아 둔 메시지부터 전송
+        self._flush_pending()
+
+        slow_users = self._enqueue_all(message_data, label)
+        if slow_users:
+            await self.remove_users([user.id for user in slow_users])
+
+    def _enqueue_all(self, message_data: bytes, label: str) -> List[User]:
+        """모든 사용자의 송신 대기열에 추가하고, 대기열이 가득 찬 사용자를 반환"""
+        slow_users = []
 
         for user in self.users.values():
             try:
-                await user.websocket.send(message_data)
-            except ConnectionClosed:
-                disconnected_users.append(user.id)
-            except Exception as e:
-                logger.error(f"메시지 전송 실패 (사용자: {user.username}): {e}")
-                disconnected_users.append(user.id)
+                user.out_queue.put_nowait(message_data)
+            except asyncio.QueueFull:
+                slow_users.append(user)
 
-        # 연결이 끊어진 사용자들 제거
-        for user_id in disconnected_users:
-            await self.remove_user(user_id)
+        for user in slow_users:
+            self._mark_slow(user, label)
+        return slow_users
 
-    async def send_user_list(self) -> None:
-        """사용자 목록 전송"""
-        user_list_data = {
-            "type": MessageType.USER_LIST.value,
-            "users": [user.to_dict() for user in self.users.values()],
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        message_data = json.dumps(user_list_data)
-        disconnected_users = []
+    def send_to(self, user: User, message_data: bytes) -> bool:
+        """
+        한 사용자에게 메시지 전송 (대기열 경유)
 
-        for user in self.users.values():
-            try:
-                await user.websocket.send(message_data)
-            except ConnectionClosed:
-                disconnected_users.append(user.id)
-            except Exception as e:
-                logger.error(f"사용자 목록 전송 실패 (사용자: {user.username}): {e}")
-                disconnected_users.append(user.id)
+        브로드캐스트와 같은 대기열을 거치므로 메시지 순서가 유지됩니다.
 
-        # 연결이 끊어진 사용자들 제거
-        for user_id in disconnected_users:
-            await self.remove_user(user_id)
+        Returns:
+            대기열에 추가했으면 True, 대기열이 가득 찼으면 False
+        """
+        try:
+            user.out_queue.put_nowait(message_data)
+            return True
+        except asyncio.QueueFull:
+            self._mark_slow(user, "개별 메시지")
+            return False
+
+    def _mark_slow(self, user: User, label: str) -> None:
+        """송신 대기열이 가득 찬 사용자의 연결을 즉시 끊음"""
+        logger.warning(f"{label} 전송 실패 - 송신 대기열 초과 (사용자: {user.username})")
+        # 닫기 핸드셰이크를 기다리지 않고 끊어서 수신 루프가 바로 종료되게 함
+        user.websocket.transport.abort()
+
+    async def _writer_loop(self, user: User) -> None:
+        """사용자별 전송 태스크: 대기열의 메시지를 순서대로 전송"""
+        try:
+            while True:
+                message_data = await user.out_queue.get()
+                # 이미 UTF-8로 인코딩된 bytes를 텍스트 프레임으로 그대로 전송
+                async with self._send_sem:
+                    await asyncio.wait_for(
+                        user.websocket.send(message_data, text=True),
+                        timeout=self.send_timeout,
+                    )
+        except asyncio.CancelledError:
+            raise
+        except ConnectionClosed:
+            pass
+        except Exception as e:
+            # 타임아웃 등으로 상태를 알 수 없는 연결은 끊음
+            logger.error(f"메시지 전송 실패 (사용자: {user.username}): {e!r}")
+            user.websocket.transport.abort()
+        await self.remove_user(user.id)
 
     async def send_message_history(self, user_id: str, limit: int = 20) -> None:
         """메시지 히스토리 전송"""
@@ -215,7 +464,8 @@ class ChatRoom:
             return
 
         user = self.users[user_id]
-        recent_messages = self.message_history[-limit:] if self.message_history else []
+        history = self.message_history
+        recent_messages = islice(history, max(0, len(history) - limit), None)
 
         history_data = {
             "type": "message_history",
@@ -223,10 +473,7 @@ class ChatRoom:
             "timestamp": datetime.now().isoformat(),
         }
 
-        try:
-            await user.websocket.send(json.dumps(history_data))
-        except Exception as e:
-            logger.error(f"메시지 히스토리 전송 실패: {e}")
+        self.send_to(user, orjson.dumps(history_data))
 
     def get_room_stats(self) -> dict:
         """채팅방 통계"""
@@ -238,6 +485,10 @@ class ChatRoom:
         }
 
 
+# 메시지 타입별 처리기: (사용자, 파싱된 메시지) -> None
+MessageHandler = Callable[[User, Dict[str, Any]], Awaitable[None]]
+
+
 class ChatServer:
     """채팅 서버 클래스"""
 
@@ -246,25 +497,28 @@ class ChatServer:
         self.port = port
         self.chat_room = ChatRoom()
         self.heartbeat_interval = 30  # 30초마다 하트비트
+        # 메시지 타입 → 처리기 (if/elif 연쇄 대신 딕셔너리 조회 한 번)
+        self._handlers: Dict[str, MessageHandler] = {
+            "chat_message": self._handle_chat,
+            "heartbeat": self._handle_heartbeat,
+            "get_users": self._handle_get_users,
+            "get_history": self._handle_get_history,
+        }
 
     async def handle_client(
-        self, websocket: WebSocketServerProtocol, path: str
+        self, websocket: ServerConnection, path: str
     ) -> None:
         """클라이언트 연결 처리"""
         user = None
 
         try:
             # 사용자명 요청
-            await websocket.send(
-                json.dumps(
-                    {"type": "request_username", "message": "사용자명을 입력하세요:"}
-                )
-            )
+            await websocket.send(_USERNAME_REQUEST, text=True)
 
             # 사용자명 수신
             username_response = await websocket.recv()
-            username_data = json.loads(username_response)
-            username = username_data.get("username", f"User_{uuid.uuid4().hex[:8]}")
+            username_data = orjson.loads(username_response)
+            username = username_data.get("username", f"User_{urandom(4).hex()}")
 
             # 사용자 추가
             user = await self.chat_room.add_user(websocket, username)
@@ -284,80 +538,94 @@ class ChatServer:
             if user:
                 await self.chat_room.remove_user(user.id)
 
-    async def process_message(self, user: User, message: str) -> None:
-        """메시지 처리"""
+    async def process_message(self, user: User, message: Union[str, bytes]) -> None:
+        """
+        메시지 처리
+
+        텍스트 프레임과 바이너리 프레임 모두 orjson으로 파싱하며, 바이너리
+        프레임은 UTF-8 문자열로 디코딩하지 않고 bytes를 바로 파싱합니다.
+        """
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             message_type = data.get("type", "message")
 
-            if message_type == "chat_message":
-                # 채팅 메시지
-                chat_text = data.get("message", "").strip()
-                if chat_text:
-                    await self.chat_room.send_message(user.id, chat_text)
-
-            elif message_type == "heartbeat":
-                # 하트비트 응답
-                user.last_activity = datetime.now()
-                await user.websocket.send(
-                    json.dumps(
-                        {
-                            "type": "heartbeat_response",
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                    )
-                )
-
-            elif message_type == "get_users":
-                # 사용자 목록 요청
-                await self.chat_room.send_user_list()
-
-            elif message_type == "get_history":
-                # 메시지 히스토리 요청
-                limit = data.get("limit", 20)
-                await self.chat_room.send_message_history(user.id, limit)
-
-            else:
-                # 알 수 없는 메시지 타입
-                await user.websocket.send(
-                    json.dumps(
-                        {
-                            "type": "error",
-                            "message": f"알 수 없는 메시지 타입: {message_type}",
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                    )
-                )
+            # 메시지 타입별 처리기를 테이블에서 한 번에 조회
+            handler = self._handlers.get(message_type, self._handle_unknown)
+            await handler(user, data)
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # JSON이 아닌 일반 텍스트 메시지
-            if message.strip():
+            if isinstance(message, bytes):
+                message = message.decode("utf-8", errors="replace")
+            # 비어 있는지 확인하려고 strip() 사본을 만들지 않음
+            if message and not message.isspace():
                 await self.chat_room.send_message(user.id, message)
         except Exception as e:
             logger.error(f"메시지 처리 중 오류: {e}")
 
+    async def _handle_chat(self, user: User, data: Dict[str, Any]) -> None:
+        """채팅 메시지"""
+        chat_text = data.get("message")
+        if chat_text:
+            chat_text = chat_text.strip()
+        if chat_text:
+            await self.chat_room.send_message(user.id, chat_text)
+
+    async def _handle_heartbeat(self, user: User, data: Dict[str, Any]) -> None:
+        """하트비트 응답"""
+        self.chat_room.touch_user(user)
+        timestamp = datetime.now().isoformat().encode()
+        self.chat_room.send_to(user, _HEARTBEAT_PREFIX + timestamp + _HEARTBEAT_SUFFIX)
+
+    async def _handle_get_users(self, user: User, data: Dict[str, Any]) -> None:
+        """사용자 목록 요청"""
+        await self.chat_room.send_user_list()
+
+    async def _handle_get_history(self, user: User, data: Dict[str, Any]) -> None:
+        """메시지 히스토리 요청"""
+        limit = data.get("limit", 20)
+        await self.chat_room.send_message_history(user.id, limit)
+
+    async def _handle_unknown(self, user: User, data: Dict[str, Any]) -> None:
+        """알 수 없는 메시지 타입"""
+        message_type = data.get("type", "message")
+        self.chat_room.send_to(
+            user,
+            orjson.dumps(
+                {
+                    "type": "error",
+                    "message": f"알 수 없는 메시지 타입: {message_type}",
+                    "timestamp": datetime.now().isoformat(),
+                }
+            ),
+        )
+
     async def heartbeat_monitor(self) -> None:
         """하트비트 모니터링"""
+        loop = asyncio.get_running_loop()
         while True:
             await asyncio.sleep(self.heartbeat_interval)
 
-            current_time = datetime.now()
+            # 2배 시간 동안 활동이 없으면 비활성으로 판단
+            cutoff = loop.time() - self.heartbeat_interval * 2
             inactive_users = []
 
-            # 비활성 사용자 확인
+            # 비활성 사용자 확인 - 활동 순서로 정렬되어 있으므로
+            # 처음으로 활동 중인 사용자를 만나면 나머지는 볼 필요 없음
             for user in self.chat_room.users.values():
-                time_diff = (current_time - user.last_activity).total_seconds()
-                if time_diff > self.heartbeat_interval * 2:  # 2배 시간 동안 비활성
-                    inactive_users.append(user.id)
+                if user.last_activity_mono >= cutoff:
+                    break
+                inactive_users.append(user.id)
 
-            # 비활성 사용자 제거
-            for user_id in inactive_users:
-                await self.chat_room.remove_user(user_id)
-                logger.info(f"비활성 사용자 제거: {user_id}")
+            # 비활성 사용자 제거 (퇴장 알림은 한 번에)
+            if inactive_users:
+                await self.chat_room.remove_users(inactive_users)
+                logger.info(f"비활성 사용자 제거: {', '.join(inactive_users)}")
 
     async def start_server(self) -> None:
         """서버 시작"""
         logger.info(f"채팅 서버 시작: ws://{self.host}:{self.port}")
+        logger.info(f"이벤트 루프: {type(asyncio.get_running_loop()).__module__}")
 
         # 하트비트 모니터링 시작
         heartbeat_task = asyncio.create_task(self.heartbeat_monitor())
@@ -365,7 +633,7 @@ class ChatServer:
         try:
             # 핸들러 래퍼 함수 생성 (self 바인딩을 위해 필요)
             # websockets 라이브러리 버전에 따라 인자 개수가 다를 수 있음
-            async def handler(websocket: WebSocketServerProtocol, *args) -> None:
+            async def handler(websocket: ServerConnection, *args) -> None:
                 path = args[0] if args else ""
                 await self.handle_client(websocket, path)
 
@@ -376,6 +644,10 @@ class ChatServer:
                 ping_interval=20,
                 ping_timeout=10,
                 close_timeout=10,
+                max_size=2**16,  # 채팅 메시지 최대 크기 (64 KiB)
+                # permessage-deflate를 쓰면 같은 브로드캐스트 내용을 연결마다
+                # 따로 압축하게 되므로 끔 (짧은 채팅 메시지는 압축 이득도 작음)
+                compression=None,
             ):
                 logger.info("채팅 서버가 실행 중입니다.")
                 await asyncio.Future()  # 서버를 계속 실행
@@ -389,7 +661,7 @@ class ChatClient:
     def __init__(self, uri: str, username: str):
         self.uri = uri
         self.username = username
-        self.websocket: Optional[websockets.WebSocketServerProtocol] = None
+        self.websocket: Optional[ClientConnection] = None
         self.running = False
 
     async def connect(self) -> None:
@@ -400,7 +672,7 @@ class ChatClient:
             logger.info(f"채팅 서버에 연결됨: {self.uri}")
 
             # 사용자명 전송
-            await self.websocket.send(json.dumps({"username": self.username}))
+            await self.websocket.send(orjson.dumps({"username": self.username}))
 
         except Exception as e:
             logger.error(f"서버 연결 실패: {e}")
@@ -419,7 +691,8 @@ class ChatClient:
             raise RuntimeError("서버에 연결되지 않았습니다")
 
         message_data = {"type": "chat_message", "message": message}
-        await self.websocket.send(json.dumps(message_data))
+        # JSON은 바이너리 프레임(UTF-8 bytes)으로 전송
+        await self.websocket.send(orjson.dumps(message_data))
 
     async def listen_for_messages(self) -> None:
         """메시지 수신 대기"""
@@ -460,6 +733,13 @@ class ChatClient:
                     elif message_type == "error":
                         # 오류 메시지
                         print(f"❌ 오류: {data.get('message', '')}")
+                    elif message_type == "messages_batch":
+                        # 서버가 한 번에 묶어 보낸 채팅 메시지들
+                        for msg in data.get("messages", []):
+                            timestamp = datetime.fromisoformat(msg["timestamp"])
+                            print(
+                                f"[{timestamp.strftime('%H:%M:%S')}] {msg['username']}: {msg['message']}"
+                            )
                     else:
                         # 일반 채팅 메시지
                         timestamp = datetime.fromisoformat(data["timestamp"])
@@ -484,23 +764,26 @@ class ChatClient:
 
         # 메시지 수신 태스크 시작
         receive_task = asyncio.create_task(self.listen_for_messages())
+        stdin = StdinReader()
 
         try:
             while self.running:
                 # 사용자 입력 받기 (타임아웃 제거)
                 try:
-                    user_input = await asyncio.get_event_loop().run_in_executor(
-                        None, input
-                    )
+                    user_input = await stdin.readline()
+                    if user_input is None:  # 입력 종료 (EOF)
+                        break
 
                     if user_input.strip():
                         if user_input.strip() == "/quit":
                             break
                         elif user_input.strip() == "/users":
-                            await self.websocket.send(json.dumps({"type": "get_users"}))
+                            await self.websocket.send(
+                                orjson.dumps({"type": "get_users"})
+                            )
                         elif user_input.strip() == "/history":
                             await self.websocket.send(
-                                json.dumps({"type": "get_history", "limit": 10})
+                                orjson.dumps({"type": "get_history", "limit": 10})
                             )
                         else:
                             await self.send_message(user_input)
@@ -513,6 +796,7 @@ class ChatClient:
 
         finally:
             self.running = False
+            stdin.close()
             receive_task.cancel()
             try:
                 await receive_task
@@ -531,11 +815,16 @@ async def demo_chat_server():
     print("명령어: 'stop' 또는 'quit' 입력 시 서버 종료")
     print("-" * 50)
 
+    stdin = StdinReader()
+
     try:
         # 사용자 입력을 받아서 서버 종료
         while True:
             try:
-                user_input = await asyncio.get_event_loop().run_in_executor(None, input)
+                user_input = await stdin.readline()
+                if user_input is None:  # 입력 종료 (EOF)
+                    print("서버 종료 중...")
+                    break
 
                 if user_input.strip().lower() in ["stop", "quit", "exit"]:
                     print("서버 종료 중...")
@@ -550,6 +839,7 @@ async def demo_chat_server():
                 logger.error(f"입력 처리 중 오류: {e}")
                 break
     finally:
+        stdin.close()
         # 서버 태스크 취소
         server_task.cancel()
         try:
@@ -593,4 +883,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    # uvloop이 설치되어 있으면 기본 이벤트 루프 대신 사용 (Windows 미지원)
+    if uvloop is not None and sys.platform != "win32":
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     asyncio.run(main())
@@ -4,21 +4,32 @@
 """
 
 import asyncio
-import json
+import bisect
+import heapq
+import inspect
+import itertools
 import logging
+import math
 import random
 import time
-import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Any, Callable
+from typing import Dict, FrozenSet, List, Optional, Set, Any, Callable, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 from collections import defaultdict, deque
 import statistics
 
+import orjson
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # 없으면 statistics 모듈로 집계
+
 try:
     import websockets
-    from websockets.server import WebSocketServerProtocol
+    from websockets.asyncio.client import ClientConnection
+    from websockets.asyncio.server import ServerConnection
     from websockets.exceptions import ConnectionClosed
 except ImportError:
     print("websockets 라이브러리가 설치되지 않았습니다.")
@@ -29,6 +40,104 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 클라이언트별 송신 대기열 크기 (가득 차면 가장 오래된 메시지부터 버림)
+OUT_QUEUE_SIZE = 256
+# 이 시간 동안 쌓인 메시지는 JSON 배열 하나로 묶어 한 프레임으로 전송 (초)
+BATCH_WINDOW = 0.02
+# 송신 버퍼가 이보다 작을 때만 대기열을 거치지 않고 바로 브로드캐스트 (바이트)
+DIRECT_SEND_BUFFER_LIMIT = 2**15
+# (스트림 타입, 윈도우 크기)별로 보관할 집계 결과 캐시 항목 수
+AGG_CACHE_SIZE = 64
+# 지연 기반 가중치의 하한 (설정 가중치 대비 비율)
+MIN_WEIGHT_FACTOR = 0.01
+# 현재 시각 캐시를 갱신하는 최소 간격 (초)
+CLOCK_RESOLUTION = 0.01
+
+# 스트림 생성기가 고르는 값 목록
+_SENSOR_LOCATIONS = ("room1", "room2", "room3")
+_USER_ACTIONS = ("login", "logout", "page_view", "click", "purchase")
+_USER_PAGES = ("/home", "/products", "/cart", "/checkout")
+_MARKET_SYMBOLS = ("AAPL", "GOOGL", "MSFT", "TSLA")
+
+# 타임스탬프만 바뀌는 응답의 미리 인코딩한 앞/뒤 부분 (orjson.dumps 생략)
+_PONG_PREFIX = b'{"type":"pong","timestamp":"'
+_INVALID_JSON_PREFIX = (
+    b'{"type":"error","message":"'
+    + "유효하지 않은 JSON 메시지".encode()
+    + b'","timestamp":"'
+)
+_TIMESTAMP_SUFFIX = b'"}'
+
+
+class RandomPool:
+    """
+    난수를 미리 한 번에 생성해 두고 하나씩 꺼내 쓰는 난수 풀
+
+    NumPy가 있으면 numpy.random.Generator로 size개씩 생성해 호출당 비용을
+    줄이고, 없으면 표준 random 모듈을 그대로 사용합니다.
+    """
+
+    def __init__(self, size: int = 4096):
+        self._size = size
+        self._pool: List[float] = []
+        self._index = 0
+        if np is not None:
+            self._rng = np.random.default_rng()
+        else:
+            self._rng = None
+            self.random = random.random
+
+    def random(self) -> float:
+        """[0, 1) 범위의 난수"""
+        if self._index >= len(self._pool):
+            self._pool = self._rng.random(self._size).tolist()
+            self._index = 0
+        value = self._pool[self._index]
+        self._index += 1
+        return value
+
+    def uniform(self, a: float, b: float) -> float:
+        return a + (b - a) * self.random()
+
+    def randint(self, a: int, b: int) -> int:
+        """a 이상 b 이하의 정수"""
+        return a + int(self.random() * (b - a + 1))
+
+    def choice(self, seq):
+        return seq[int(self.random() * len(seq))]
+
+
+class CoarseClock:
+    """
+    CLOCK_RESOLUTION 간격으로만 갱신되는 현재 시각 캐시
+
+    생성기와 응답마다 datetime.now()와 isoformat()을 호출하지 않도록
+    같은 틱 안의 호출은 캐시된 값을 돌려줍니다. 주기 태스크 대신 조회 시점에
+    단조 시계로 만료 여부를 확인하므로 유휴 상태에서는 깨어나지 않습니다.
+    """
+
+    def __init__(self, resolution: float = CLOCK_RESOLUTION):
+        self.resolution = resolution
+        self._expires_at = 0.0
+        self._now = datetime.now()
+        self._now_iso: Optional[str] = None
+
+    def now(self) -> datetime:
+        """현재 시각 (최대 resolution만큼 지난 값일 수 있음)"""
+        mono = time.monotonic()
+        if mono >= self._expires_at:
+            self._now = datetime.now()
+            self._now_iso = None
+            self._expires_at = mono + self.resolution
+        return self._now
+
+    def now_iso(self) -> str:
+        """현재 시각의 ISO 8601 문자열 (필요할 때 한 번만 포맷)"""
+        now = self.now()
+        if self._now_iso is None:
+            self._now_iso = now.isoformat()
+        return self._now_iso
+
 
 class StreamType(Enum):
     """스트림 타입"""
@@ -40,9 +149,9 @@ class StreamType(Enum):
     LOG_EVENTS = "log_events"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StreamData:
-    """스트림 데이터"""
+    """스트림 데이터 (초당 여러 개 생성되므로 __dict__ 없는 불변 객체)"""
 
     id: str
     stream_type: StreamType
@@ -50,58 +159,232 @@ class StreamData:
     timestamp: datetime
     source: str
 
-    def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "stream_type": self.stream_type.value,
-            "data": self.data,
-            "timestamp": self.timestamp.isoformat(),
-            "source": self.source,
-        }
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ClientSubscription:
     """클라이언트 구독 정보"""
 
     client_id: str
-    stream_types: Set[StreamType]
+    stream_types: FrozenSet[StreamType]
     filters: Dict[str, Any]
     last_activity: datetime
 
 
+class SlidingWindowStats:
+    """
+    고정 크기 슬라이딩 윈도우의 통계를 값이 들어올 때마다 O(1)로 갱신
+
+    평균과 분산은 Welford 방식으로 추가/제거를 반영하고, 최솟값과 최댓값은
+    단조 덱(monotonic deque)으로 유지하므로 조회할 때 윈도우를 다시 훑지 않습니다.
+    """
+
+    def __init__(self, window_size: int):
+        self.window_size = window_size
+        self.values: deque = deque()
+        self.mean = 0.0
+        self._m2 = 0.0  # 평균과의 편차 제곱합
+        self._index = 0
+        self._min_deque: deque = deque()  # (인덱스, 값), 값이 증가하는 순서
+        self._max_deque: deque = deque()  # (인덱스, 값), 값이 감소하는 순서
+
+    def push(self, value: float) -> None:
+        """새 값 추가 (윈도우가 가득 차면 가장 오래된 값 제거)"""
+        if len(self.values) == self.window_size:
+            self._remove(self.values.popleft())
+
+        self.values.append(value)
+        count = len(self.values)
+        delta = value - self.mean
+        self.mean += delta / count
+        self._m2 += delta * (value - self.mean)
+
+        index = self._index
+        self._index += 1
+        oldest = index - self.window_size
+        while self._min_deque and self._min_deque[-1][1] >= value:
+            self._min_deque.pop()
+        self._min_deque.append((index, value))
+        if self._min_deque[0][0] <= oldest:
+            self._min_deque.popleft()
+        while self._max_deque and self._max_deque[-1][1] <= value:
+            self._max_deque.pop()
+        self._max_deque.append((index, value))
+        if self._max_deque[0][0] <= oldest:
+            self._max_deque.popleft()
+
+    def _remove(self, value: float) -> None:
+        """윈도우에서 빠진 값을 평균과 편차 제곱합에서 제외"""
+        count = len(self.values)
+        if count == 0:
+            self.mean = 0.0
+            self._m2 = 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / count
+        self._m2 -= delta * (value - self.mean)
+
+    @property
+    def count(self) -> int:
+        return len(self.values)
+
+    @property
+    def std(self) -> float:
+        """표본 표준편차 (statistics.stdev와 같은 n-1 기준)"""
+        count = len(self.values)
+        if count < 2:
+            return 0
+        return math.sqrt(max(0.0, self._m2 / (count - 1)))
+
+    @property
+    def min(self) -> float:
+        return self._min_deque[0][1]
+
+    @property
+    def max(self) -> float:
+        return self._max_deque[0][1]
+
+    @property
+    def latest(self) -> float:
+        return self.values[-1]
+
+
+class FloatRingBuffer:
+    """미리 할당한 float64 배열 위의 고정 크기 링 버퍼 (NumPy 필요)"""
+
+    def __init__(self, capacity: int):
+        self._buffer = np.empty(capacity, dtype=np.float64)
+        self._pos = 0
+        self._len = 0
+
+    def append(self, value: float) -> None:
+        capacity = len(self._buffer)
+        self._buffer[self._pos] = value
+        self._pos = (self._pos + 1) % capacity
+        if self._len < capacity:
+            self._len += 1
+
+    def last(self, count: int) -> "np.ndarray":
+        """최근 count개 값을 오래된 순서로 반환 (감싸지 않으면 복사 없는 뷰)"""
+        count = min(max(count, 0), self._len)
+        start = self._pos - count
+        if start >= 0:
+            return self._buffer[start : self._pos]
+        return np.concatenate((self._buffer[start:], self._buffer[: self._pos]))
+
+
 class StreamProcessor:
     """스트림 데이터 처리기"""
 
-    def __init__(self):
+    # 스트림 타입별로 통계를 실시간 유지할 데이터 필드
+    STAT_FIELDS: Dict[StreamType, tuple] = {
+        StreamType.SENSOR_DATA: ("value",),
+        StreamType.SYSTEM_METRICS: ("cpu_usage", "memory_usage"),
+    }
+
+    def __init__(self, stats_window: int = 100):
         self.processors: Dict[StreamType, List[Callable]] = defaultdict(list)
         self.aggregators: Dict[StreamType, deque] = defaultdict(
             lambda: deque(maxlen=1000)
         )
+        # 기본 집계 윈도우의 필드별 실시간 통계
+        self.stats_window = stats_window
+        self._running: Dict[StreamType, Dict[str, SlidingWindowStats]] = {}
+        # 임의 윈도우 집계용 필드별 링 버퍼 (NumPy가 있을 때만 사용)
+        self._rings: Dict[StreamType, Dict[str, FloatRingBuffer]] = {}
+        # 집계 결과 캐시: 데이터가 추가될 때마다 스트림별 버전이 올라가 무효화됨
+        self._versions: Dict[StreamType, int] = defaultdict(int)
+        self._agg_cache: Dict[Tuple[StreamType, int], Tuple[int, Dict[str, Any]]] = {}
 
     def register_processor(self, stream_type: StreamType, processor: Callable) -> None:
-        """스트림 처리기 등록"""
+        """스트림 처리기 등록 (일반 함수와 코루틴 함수 모두 가능)"""
         self.processors[stream_type].append(processor)
 
     async def process_data(self, data: StreamData) -> StreamData:
         """데이터 처리"""
         # 데이터 집계
         self.aggregators[data.stream_type].append(data)
+        self._versions[data.stream_type] += 1
+        self._update_running_stats(data)
+
+        # 등록된 처리기가 없으면 바로 반환
+        processors = self.processors.get(data.stream_type)
+        if not processors:
+            return data
 
-        # 등록된 처리기들 실행
-        for processor in self.processors[data.stream_type]:
+        # 등록된 처리기들 실행 (동기 처리기는 코루틴을 만들지 않고 바로 실행)
+        for processor in processors:
             try:
-                data = await processor(data)
+                result = processor(data)
+                if inspect.isawaitable(result):
+                    result = await result
+                data = result
             except Exception as e:
                 logger.error(f"데이터 처리 중 오류: {e}")
 
         return data
 
+    def _update_running_stats(self, data: StreamData) -> None:
+        """새 데이터 포인트를 필드별 실시간 통계에 반영"""
+        fields = self.STAT_FIELDS.get(data.stream_type)
+        if not fields:
+            return
+
+        running = self._running.get(data.stream_type)
+        if running is None:
+            running = {
+                field: SlidingWindowStats(self.stats_window) for field in fields
+            }
+            self._running[data.stream_type] = running
+
+        for field in fields:
+            running[field].push(data.data.get(field, 0))
+
+        if np is not None:
+            rings = self._rings.get(data.stream_type)
+            if rings is None:
+                capacity = self.aggregators[data.stream_type].maxlen
+                rings = {field: FloatRingBuffer(capacity) for field in fields}
+                self._rings[data.stream_type] = rings
+            for field in fields:
+                rings[field].append(data.data.get(field, 0))
+
     def get_aggregated_data(
         self, stream_type: StreamType, window_size: int = 100
     ) -> Dict[str, Any]:
-        """집계된 데이터 반환"""
-        data_points = list(self.aggregators[stream_type])[-window_size:]
+        """집계된 데이터 반환 (데이터가 바뀌지 않았으면 캐시된 결과 재사용)"""
+        key = (stream_type, window_size)
+        version = self._versions[stream_type]
+        cached = self._agg_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        result = self._compute_aggregated_data(stream_type, window_size)
+        if len(self._agg_cache) >= AGG_CACHE_SIZE:
+            # 클라이언트가 임의의 윈도우 크기를 요청할 수 있으므로 크기 제한
+            self._agg_cache.clear()
+        self._agg_cache[key] = (version, result)
+        return result
+
+    def _compute_aggregated_data(
+        self, stream_type: StreamType, window_size: int
+    ) -> Dict[str, Any]:
+        """집계 데이터 계산"""
+        # 기본 윈도우는 실시간 통계로 바로 응답 (윈도우 재계산 없음)
+        running = self._running.get(stream_type)
+        if running is not None and window_size == self.stats_window:
+            return self._aggregate_running(stream_type, running)
+
+        rings = self._rings.get(stream_type)
+        if rings is not None:
+            return self._aggregate_rings(stream_type, rings, window_size)
+
+        # 전체 덱을 복사하지 않고 뒤에서부터 필요한 만큼만 꺼냄
+        data_points = list(
+            itertools.islice(
+                reversed(self.aggregators[stream_type]), max(window_size, 0)
+            )
+        )
+        data_points.reverse()
 
         if not data_points:
             return {}
@@ -135,6 +418,68 @@ class StreamProcessor:
 
         return {"count": len(data_points)}
 
+    @staticmethod
+    def _aggregate_rings(
+        stream_type: StreamType, rings: Dict[str, FloatRingBuffer], window_size: int
+    ) -> Dict[str, Any]:
+        """링 버퍼의 최근 window_size개 값을 NumPy 벡터 연산으로 집계"""
+        if stream_type == StreamType.SENSOR_DATA:
+            values = rings["value"].last(window_size)
+            if not len(values):
+                return {}
+            return {
+                "count": len(values),
+                "mean": float(values.mean()),
+                "min": float(values.min()),
+                "max": float(values.max()),
+                "std": float(values.std(ddof=1)) if len(values) > 1 else 0,
+                "latest": float(values[-1]),
+            }
+
+        cpu_values = rings["cpu_usage"].last(window_size)
+        memory_values = rings["memory_usage"].last(window_size)
+        if not len(cpu_values):
+            return {}
+        return {
+            "cpu": {
+                "mean": float(cpu_values.mean()),
+                "max": float(cpu_values.max()),
+                "current": float(cpu_values[-1]),
+            },
+            "memory": {
+                "mean": float(memory_values.mean()),
+                "max": float(memory_values.max()),
+                "current": float(memory_values[-1]),
+            },
+        }
+
+    @staticmethod
+    def _aggregate_running(
+        stream_type: StreamType, running: Dict[str, SlidingWindowStats]
+    ) -> Dict[str, Any]:
+        """실시간 통계로 get_aggregated_data와 같은 형태의 결과 생성"""
+        if stream_type == StreamType.SENSOR_DATA:
+            stats = running["value"]
+            return {
+                "count": stats.count,
+                "mean": stats.mean,
+                "min": stats.min,
+                "max": stats.max,
+                "std": stats.std,
+                "latest": stats.latest,
+            }
+
+        cpu = running["cpu_usage"]
+        memory = running["memory_usage"]
+        return {
+            "cpu": {"mean": cpu.mean, "max": cpu.max, "current": cpu.latest},
+            "memory": {
+                "mean": memory.mean,
+                "max": memory.max,
+                "current": memory.latest,
+            },
+        }
+
 
 class LoadBalancer:
     """로드 밸런서"""
@@ -143,6 +488,14 @@ class LoadBalancer:
         self.servers: Dict[str, Dict[str, Any]] = {}
         self.server_weights: Dict[str, float] = {}
         self.current_connections: Dict[str, int] = defaultdict(int)
+        # 선택 가능한 서버와 누적 가중치 (선택 가능 여부가 바뀔 때만 다시 계산)
+        self._active_ids: List[str] = []
+        self._cum_weights: List[float] = []
+        self._dirty = True
+        # P2C 동률일 때 번갈아 고르기 위한 라운드 로빈 카운터
+        self._tie_breaker = itertools.count()
+        # 서버별 응답 지연 지수이동평균 (밀리초)
+        self.latency_ema: Dict[str, float] = {}
 
     def add_server(self, server_id: str, capacity: int, weight: float = 1.0) -> None:
         """서버 추가"""
@@ -152,42 +505,113 @@ class LoadBalancer:
             "status": "active",
         }
         self.server_weights[server_id] = weight
+        self._dirty = True
 
-    def get_best_server(self) -> Optional[str]:
-        """최적 서버 선택"""
-        available_servers = [
+    def set_server_status(self, server_id: str, status: str) -> None:
+        """서버 상태 변경 ("active"가 아니면 선택 대상에서 제외)"""
+        self.servers[server_id]["status"] = status
+        self._dirty = True
+
+    def _rebuild(self) -> None:
+        """선택 가능한 서버 목록과 누적 가중치 배열 재계산"""
+        self._active_ids = [
             server_id
             for server_id, server in self.servers.items()
             if server["status"] == "active"
             and self.current_connections[server_id] < server["capacity"]
         ]
 
+        total = 0.0
+        self._cum_weights = []
+        for server_id in self._active_ids:
+            total += self.server_weights[server_id]
+            self._cum_weights.append(total)
+        self._dirty = False
+
+    def get_best_server(self) -> Optional[str]:
+        """최적 서버 선택 (누적 가중치 이진 탐색, O(log S))"""
+        if self._dirty:
+            self._rebuild()
+
+        available_servers = self._active_ids
         if not available_servers:
             return None
 
         # 가중치 기반 선택
-        total_weight = sum(
-            self.server_weights[server_id] for server_id in available_servers
-        )
+        total_weight = self._cum_weights[-1]
         if total_weight == 0:
             return available_servers[0]
 
-        choice = random.uniform(0, total_weight)
-        current_weight = 0
-
-        for server_id in available_servers:
-            current_weight += self.server_weights[server_id]
-            if choice <= current_weight:
-                return server_id
-
-        return available_servers[-1]
+        choice = random.random() * total_weight
+        index = bisect.bisect_left(self._cum_weights, choice)
+        return available_servers[min(index, len(available_servers) - 1)]
+
+    def observe(self, server_id: str, latency_ms: float) -> None:
+        """
+        관측한 전송 지연을 반영해 서버 가중치 조정
+
+        지연의 지수이동평균(32샘플 반감 수준)을 유지하고 가중치를
+        `설정 가중치 / (1 + 평균 지연)`으로 낮춰 느린 서버가 점차 덜 선택되게
+        합니다. 완전히 배제되지 않도록 설정 가중치의 1%를 하한으로 둡니다.
+        """
+        server = self.servers.get(server_id)
+        if server is None:
+            return
+
+        ema = self.latency_ema.get(server_id)
+        ema = latency_ms if ema is None else (ema * 31 + latency_ms) / 32
+        self.latency_ema[server_id] = ema
+
+        base_weight = server["weight"]
+        self.server_weights[server_id] = max(
+            base_weight / (1 + ema), base_weight * MIN_WEIGHT_FACTOR
+        )
+        # 누적 가중치는 다음 선택 때 다시 계산
+        self._dirty = True
+
+    def pick_p2c(self) -> Optional[str]:
+        """
+        Power of Two Choices 선택
+
+        무작위로 고른 두 서버 중 연결 수가 적은 쪽을 선택합니다. 누적 가중치
+        없이 상수 시간에 동작하며, 순수 무작위 선택보다 최대 부하가 크게
+        줄어듭니다. 동률이면 라운드 로빈으로 번갈아 고릅니다.
+        """
+        if self._dirty:
+            self._rebuild()
+
+        available_servers = self._active_ids
+        if len(available_servers) < 2:
+            return available_servers[0] if available_servers else None
+
+        first, second = random.sample(available_servers, 2)
+        first_connections = self.current_connections[first]
+        second_connections = self.current_connections[second]
+        if first_connections == second_connections:
+            return (first, second)[next(self._tie_breaker) & 1]
+        return first if first_connections < second_connections else second
+
+    def pick_least_connections(self) -> Optional[str]:
+        """연결 수가 가장 적은 서버 선택 (least connections)"""
+        if self._dirty:
+            self._rebuild()
+
+        if not self._active_ids:
+            return None
+        return min(self._active_ids, key=self.current_connections.__getitem__)
 
     def update_connections(self, server_id: str, delta: int) -> None:
         """연결 수 업데이트"""
-        self.current_connections[server_id] += delta
-        self.current_connections[server_id] = max(
-            0, self.current_connections[server_id]
-        )
+        before = self.current_connections[server_id]
+        after = max(0, before + delta)
+        self.current_connections[server_id] = after
+
+        # 용량 경계를 넘나들 때만 선택 가능한 서버 목록이 바뀜
+        server = self.servers.get(server_id)
+        if server is not None:
+            capacity = server["capacity"]
+            if (before < capacity) != (after < capacity):
+                self._dirty = True
 
 
 class AdvancedWebSocketServer:
@@ -196,10 +620,22 @@ class AdvancedWebSocketServer:
     def __init__(self, host: str = "localhost", port: int = 8765):
         self.host = host
         self.port = port
-        self.clients: Dict[str, WebSocketServerProtocol] = {}
+        self.clients: Dict[str, ServerConnection] = {}
+        # 클라이언트별 송신 대기열과 이를 비우는 전송 태스크
+        self.client_queues: Dict[str, asyncio.Queue] = {}
+        self.writer_tasks: Dict[str, asyncio.Task] = {}
+        # 대기열이 비어 다음 메시지를 기다리고 있는 전송 태스크의 클라이언트 ID
+        self._idle_writers: Set[str] = set()
         self.subscriptions: Dict[str, ClientSubscription] = {}
+        # 스트림 타입별 구독자 ID (구독/해제 시점에 갱신하는 역색인)
+        self._subscribers_by_type: Dict[StreamType, Set[str]] = defaultdict(set)
         self.stream_processor = StreamProcessor()
         self.load_balancer = LoadBalancer()
+        self.clock = CoarseClock()
+        self._rand = RandomPool()
+        # 이벤트/클라이언트 ID: 프로세스 시작 시각 접두어 + 단조 증가 카운터
+        self._id_prefix = f"{time.time_ns():x}"
+        self._next_id = itertools.count(1)
         self.metrics = {
             "total_connections": 0,
             "active_connections": 0,
@@ -212,18 +648,59 @@ class AdvancedWebSocketServer:
         self._register_stream_generators()
         self._register_data_processors()
 
+    def _new_id(self) -> str:
+        """프로세스 안에서 고유한 ID 생성 (시스템 콜 없음)"""
+        return f"{self._id_prefix}-{next(self._next_id)}"
+
     def _register_stream_generators(self) -> None:
-        """스트림 생성기 등록"""
-        asyncio.create_task(self._generate_sensor_data())
-        asyncio.create_task(self._generate_system_metrics())
-        asyncio.create_task(self._generate_user_activity())
-        asyncio.create_task(self._generate_market_data())
+        """스트림 생성기 등록 (생성 주기는 스케줄러 태스크 하나가 관리)"""
+        self._stream_generators: List[Tuple[float, Callable[[], StreamData]]] = [
+            (1.0, self._generate_sensor_data),  # 1초마다
+            (2.0, self._generate_system_metrics),  # 2초마다
+            (5.0, self._generate_user_activity),  # 5초마다
+            (0.5, self._generate_market_data),  # 0.5초마다
+        ]
+        self._scheduler_task = asyncio.create_task(self._run_stream_scheduler())
+
+    async def _run_stream_scheduler(self) -> None:
+        """
+        다음 실행 시각 힙으로 모든 스트림 생성기를 한 태스크에서 실행
+
+        생성기마다 태스크와 sleep을 따로 두지 않고, 가장 먼저 실행할 생성기까지만
+        기다립니다. 다음 실행 시각은 이전 예정 시각 기준이라 주기가 밀리지 않습니다.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        heap = [
+            (start + interval, order, interval, generator)
+            for order, (interval, generator) in enumerate(self._stream_generators)
+        ]
+        heapq.heapify(heap)
+
+        while True:
+            due, order, interval, generator = heap[0]
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            try:
+                await self._broadcast_stream_data(generator())
+            except Exception as e:
+                # 한 스트림의 오류가 다른 스트림 생성까지 멈추지 않도록 함
+                logger.error(f"스트림 데이터 생성 중 오류: {e}")
+
+            next_due = due + interval
+            now = loop.time()
+            if next_due < now - interval:
+                # 한 주기 이상 밀렸으면 몰아서 실행하지 않고 지금부터 다시 계산
+                next_due = now + interval
+            heapq.heapreplace(heap, (next_due, order, interval, generator))
 
     def _register_data_processors(self) -> None:
         """데이터 처리기 등록"""
 
         # 센서 데이터 이상치 탐지
-        async def detect_anomalies(data: StreamData) -> StreamData:
+        def detect_anomalies(data: StreamData) -> StreamData:
             if data.stream_type == StreamType.SENSOR_DATA:
                 value = data.data.get("value", 0)
                 aggregated = self.stream_processor.get_aggregated_data(
@@ -244,7 +721,7 @@ class AdvancedWebSocketServer:
             return data
 
         # 시스템 메트릭 임계값 체크
-        async def check_thresholds(data: StreamData) -> StreamData:
+        def check_thresholds(data: StreamData) -> StreamData:
             if data.stream_type == StreamType.SYSTEM_METRICS:
                 cpu = data.data.get("cpu_usage", 0)
                 memory = data.data.get("memory_usage", 0)
@@ -266,111 +743,163 @@ class AdvancedWebSocketServer:
             StreamType.SYSTEM_METRICS, check_thresholds
         )
 
-    async def _generate_sensor_data(self) -> None:
+    def _generate_sensor_data(self) -> StreamData:
         """센서 데이터 생성"""
-        while True:
-            await asyncio.sleep(1)  # 1초마다
-
-            data = StreamData(
-                id=str(uuid.uuid4()),
-                stream_type=StreamType.SENSOR_DATA,
-                data={
-                    "value": random.uniform(20, 30),  # 온도 센서
-                    "unit": "celsius",
-                    "location": random.choice(["room1", "room2", "room3"]),
-                },
-                timestamp=datetime.now(),
-                source="temperature_sensor",
-            )
-
-            await self._broadcast_stream_data(data)
+        rand = self._rand
+        return StreamData(
+            id=self._new_id(),
+            stream_type=StreamType.SENSOR_DATA,
+            data={
+                "value": rand.uniform(20, 30),  # 온도 센서
+                "unit": "celsius",
+                "location": rand.choice(_SENSOR_LOCATIONS),
+            },
+            timestamp=self.clock.now(),
+            source="temperature_sensor",
+        )
 
-    async def _generate_system_metrics(self) -> None:
+    def _generate_system_metrics(self) -> StreamData:
         """시스템 메트릭 생성"""
-        while True:
-            await asyncio.sleep(2)  # 2초마다
-
-            data = StreamData(
-                id=str(uuid.uuid4()),
-                stream_type=StreamType.SYSTEM_METRICS,
-                data={
-                    "cpu_usage": random.uniform(10, 100),
-                    "memory_usage": random.uniform(30, 95),
-                    "disk_usage": random.uniform(20, 80),
-                    "network_io": random.uniform(0, 1000),
-                },
-                timestamp=datetime.now(),
-                source="system_monitor",
-            )
-
-            await self._broadcast_stream_data(data)
+        rand = self._rand
+        return StreamData(
+            id=self._new_id(),
+            stream_type=StreamType.SYSTEM_METRICS,
+            data={
+                "cpu_usage": rand.uniform(10, 100),
+                "memory_usage": rand.uniform(30, 95),
+                "disk_usage": rand.uniform(20, 80),
+                "network_io": rand.uniform(0, 1000),
+            },
+            timestamp=self.clock.now(),
+            source="system_monitor",
+        )
 
-    async def _generate_user_activity(self) -> None:
+    def _generate_user_activity(self) -> StreamData:
         """사용자 활동 데이터 생성"""
-        while True:
-            await asyncio.sleep(5)  # 5초마다
-
-            data = StreamData(
-                id=str(uuid.uuid4()),
-                stream_type=StreamType.USER_ACTIVITY,
-                data={
-                    "user_id": f"user_{random.randint(1, 100)}",
-                    "action": random.choice(
-                        ["login", "logout", "page_view", "click", "purchase"]
-                    ),
-                    "page": random.choice(["/home", "/products", "/cart", "/checkout"]),
-                    "session_duration": random.uniform(0, 3600),
-                },
-                timestamp=datetime.now(),
-                source="user_tracker",
-            )
-
-            await self._broadcast_stream_data(data)
+        rand = self._rand
+        return StreamData(
+            id=self._new_id(),
+            stream_type=StreamType.USER_ACTIVITY,
+            data={
+                "user_id": f"user_{rand.randint(1, 100)}",
+                "action": rand.choice(_USER_ACTIONS),
+                "page": rand.choice(_USER_PAGES),
+                "session_duration": rand.uniform(0, 3600),
+            },
+            timestamp=self.clock.now(),
+            source="user_tracker",
+        )
 
-    async def _generate_market_data(self) -> None:
+    def _generate_market_data(self) -> StreamData:
         """시장 데이터 생성"""
-        while True:
-            await asyncio.sleep(0.5)  # 0.5초마다
-
-            data = StreamData(
-                id=str(uuid.uuid4()),
-                stream_type=StreamType.MARKET_DATA,
-                data={
-                    "symbol": random.choice(["AAPL", "GOOGL", "MSFT", "TSLA"]),
-                    "price": random.uniform(100, 500),
-                    "volume": random.randint(1000, 10000),
-                    "change": random.uniform(-5, 5),
-                },
-                timestamp=datetime.now(),
-                source="market_feed",
-            )
-
-            await self._broadcast_stream_data(data)
+        rand = self._rand
+        return StreamData(
+            id=self._new_id(),
+            stream_type=StreamType.MARKET_DATA,
+            data={
+                "symbol": rand.choice(_MARKET_SYMBOLS),
+                "price": rand.uniform(100, 500),
+                "volume": rand.randint(1000, 10000),
+                "change": rand.uniform(-5, 5),
+            },
+            timestamp=self.clock.now(),
+            source="market_feed",
+        )
 
     async def _broadcast_stream_data(self, data: StreamData) -> None:
         """스트림 데이터 브로드캐스트"""
         # 데이터 처리
         processed_data = await self.stream_processor.process_data(data)
 
-        # 구독자들에게 전송
-        for client_id, subscription in self.subscriptions.items():
-            if data.stream_type in subscription.stream_types:
-                if client_id in self.clients:
-                    try:
-                        message = json.dumps(processed_data.to_dict())
-                        await self.clients[client_id].send(message)
-                        self.metrics["messages_sent"] += 1
-                    except ConnectionClosed:
-                        await self._remove_client(client_id)
-                    except Exception as e:
-                        logger.error(f"메시지 전송 실패 (클라이언트: {client_id}): {e}")
-
-    async def handle_client(
-        self, websocket: WebSocketServerProtocol, path: str
+        # 모든 구독자가 공유할 UTF-8 bytes를 한 번만 직렬화
+        # (orjson이 dataclass 필드를 그대로, Enum은 값으로, datetime은 ISO 문자열로 인코딩)
+        message = orjson.dumps(processed_data)
+
+        # 밀린 메시지가 없고 송신 버퍼도 여유 있는 구독자에게는 websockets.broadcast로
+        # 같은 bytes를 바로 쓰고, 나머지는 순서 유지를 위해 송신 대기열에 추가
+        direct = []
+        for client_id in self._subscribers_by_type.get(data.stream_type, ()):
+            websocket = self.clients.get(client_id)
+            if (
+                websocket is not None
+                and client_id in self._idle_writers
+                and self.client_queues[client_id].empty()
+                and websocket.transport.get_write_buffer_size()
+                < DIRECT_SEND_BUFFER_LIMIT
+            ):
+                direct.append(websocket)
+            else:
+                self._enqueue(client_id, message)
+
+        if direct:
+            websockets.broadcast(direct, message, text=True)
+            self.metrics["messages_sent"] += len(direct)
+
+    def _enqueue(self, client_id: str, message: bytes) -> None:
+        """
+        클라이언트 송신 대기열에 메시지 추가
+
+        느린 클라이언트 때문에 브로드캐스트가 멈추지 않도록 기다리지 않으며,
+        대기열이 가득 차면 가장 오래된 메시지를 버리고 새 메시지를 넣습니다.
+        """
+        queue = self.client_queues.get(client_id)
+        if queue is None:
+            return
+
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.put_nowait(message)
+            logger.debug(f"송신 대기열 초과 - 오래된 메시지 삭제 (클라이언트: {client_id})")
+
+    async def _writer_loop(
+        self, client_id: str, websocket: ServerConnection, queue: asyncio.Queue
     ) -> None:
-        """클라이언트 연결 처리"""
-        client_id = str(uuid.uuid4())
+        """
+        클라이언트별 전송 태스크: 대기열의 메시지를 순서대로 전송
+
+        첫 메시지가 도착한 뒤 BATCH_WINDOW 동안 쌓인 메시지는
+        JSON 배열 하나로 묶어 프레임 하나로 보냅니다.
+        """
+        try:
+            while True:
+                self._idle_writers.add(client_id)
+                try:
+                    message = await queue.get()
+                finally:
+                    self._idle_writers.discard(client_id)
+                await asyncio.sleep(BATCH_WINDOW)
+
+                if queue.empty():
+                    # bytes도 텍스트 프레임으로 그대로 전송
+                    await websocket.send(message, text=True)
+                    self.metrics["messages_sent"] += 1
+                    continue
+
+                batch = [message]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                frame = b"[" + b",".join(batch) + b"]"
+                await websocket.send(frame, text=True)
+                self.metrics["messages_sent"] += len(batch)
+        except ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.error(f"메시지 전송 실패 (클라이언트: {client_id}): {e}")
+            # 전송할 수 없는 연결은 끊어서 수신 루프가 정리하도록 함
+            websocket.transport.abort()
+
+    async def handle_client(self, websocket: ServerConnection) -> None:
+        """클라이언트 연결 처리 (websockets>=14는 핸들러에 연결만 전달)"""
+        client_id = self._new_id()
         self.clients[client_id] = websocket
+        out_queue: asyncio.Queue = asyncio.Queue(maxsize=OUT_QUEUE_SIZE)
+        self.client_queues[client_id] = out_queue
+        self.writer_tasks[client_id] = asyncio.create_task(
+            self._writer_loop(client_id, websocket, out_queue)
+        )
         self.metrics["total_connections"] += 1
         self.metrics["active_connections"] += 1
 
@@ -393,7 +922,7 @@ class AdvancedWebSocketServer:
         self.metrics["messages_received"] += 1
 
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             message_type = data.get("type", "unknown")
 
             if message_type == "subscribe":
@@ -401,11 +930,13 @@ class AdvancedWebSocketServer:
                 stream_types = [StreamType(t) for t in data.get("stream_types", [])]
                 filters = data.get("filters", {})
 
+                subscribed = frozenset(stream_types)
+                self._update_subscriber_index(client_id, subscribed)
                 self.subscriptions[client_id] = ClientSubscription(
                     client_id=client_id,
-                    stream_types=set(stream_types),
+                    stream_types=subscribed,
                     filters=filters,
-                    last_activity=datetime.now(),
+                    last_activity=self.clock.now(),
                 )
 
                 await self._send_response(
@@ -413,20 +944,21 @@ class AdvancedWebSocketServer:
                     {
                         "type": "subscription_confirmed",
                         "stream_types": [t.value for t in stream_types],
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": self.clock.now_iso(),
                     },
                 )
 
             elif message_type == "unsubscribe":
                 # 구독 해제
                 if client_id in self.subscriptions:
+                    self._update_subscriber_index(client_id, frozenset())
                     del self.subscriptions[client_id]
 
                 await self._send_response(
                     client_id,
                     {
                         "type": "unsubscription_confirmed",
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": self.clock.now_iso(),
                     },
                 )
 
@@ -440,7 +972,7 @@ class AdvancedWebSocketServer:
                         "uptime": (
                             datetime.now() - self.metrics["start_time"]
                         ).total_seconds(),
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": self.clock.now_iso(),
                     },
                 )
 
@@ -459,15 +991,13 @@ class AdvancedWebSocketServer:
                         "type": "aggregated_data",
                         "stream_type": stream_type.value,
                         "data": aggregated,
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": self.clock.now_iso(),
                     },
                 )
 
             elif message_type == "ping":
                 # 핑 응답
-                await self._send_response(
-                    client_id, {"type": "pong", "timestamp": datetime.now().isoformat()}
-                )
+                self._send_timestamped(client_id, _PONG_PREFIX)
 
             else:
                 # 알 수 없는 메시지 타입
@@ -476,19 +1006,12 @@ class AdvancedWebSocketServer:
                     {
                         "type": "error",
                         "message": f"알 수 없는 메시지 타입: {message_type}",
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": self.clock.now_iso(),
                     },
                 )
 
-        except json.JSONDecodeError:
-            await self._send_response(
-                client_id,
-                {
-                    "type": "error",
-                    "message": "유효하지 않은 JSON 메시지",
-                    "timestamp": datetime.now().isoformat(),
-                },
-            )
+        except orjson.JSONDecodeError:
+            self._send_timestamped(client_id, _INVALID_JSON_PREFIX)
         except Exception as e:
             logger.error(f"메시지 처리 중 오류: {e}")
             await self._send_response(
@@ -496,18 +1019,38 @@ class AdvancedWebSocketServer:
                 {
                     "type": "error",
                     "message": f"서버 오류: {str(e)}",
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self.clock.now_iso(),
                 },
             )
 
+    def _send_timestamped(self, client_id: str, prefix: bytes) -> None:
+        """미리 인코딩한 응답 앞부분에 현재 타임스탬프만 붙여 전송"""
+        self._enqueue(
+            client_id, prefix + self.clock.now_iso().encode() + _TIMESTAMP_SUFFIX
+        )
+
+    def _update_subscriber_index(
+        self, client_id: str, stream_types: FrozenSet[StreamType]
+    ) -> None:
+        """클라이언트의 구독 스트림이 바뀐 만큼만 역색인 갱신"""
+        subscription = self.subscriptions.get(client_id)
+        old_types = subscription.stream_types if subscription else frozenset()
+
+        for stream_type in old_types - stream_types:
+            subscribers = self._subscribers_by_type[stream_type]
+            subscribers.discard(client_id)
+            if not subscribers:
+                del self._subscribers_by_type[stream_type]
+
+        for stream_type in stream_types - old_types:
+            self._subscribers_by_type[stream_type].add(client_id)
+
     async def _send_response(self, client_id: str, response: dict) -> None:
-        """클라이언트에게 응답 전송"""
+        """클라이언트에게 응답 전송 (스트림 데이터와 같은 대기열 경유)"""
         if client_id in self.clients:
             try:
-                await self.clients[client_id].send(json.dumps(response))
-                self.metrics["messages_sent"] += 1
-            except ConnectionClosed:
-                await self._remove_client(client_id)
+                # datetime 값(예: 메트릭의 start_time)도 orjson이 ISO 형식으로 직렬화
+                self._enqueue(client_id, orjson.dumps(response))
             except Exception as e:
                 logger.error(f"응답 전송 실패 (클라이언트: {client_id}): {e}")
 
@@ -518,8 +1061,15 @@ class AdvancedWebSocketServer:
             self.metrics["active_connections"] -= 1
 
         if client_id in self.subscriptions:
+            self._update_subscriber_index(client_id, frozenset())
             del self.subscriptions[client_id]
 
+        self.client_queues.pop(client_id, None)
+        self._idle_writers.discard(client_id)
+        writer_task = self.writer_tasks.pop(client_id, None)
+        if writer_task is not None:
+            writer_task.cancel()
+
         logger.info(
             f"클라이언트 제거: {client_id} (활성 연결: {self.metrics['active_connections']})"
         )
@@ -535,6 +1085,9 @@ class AdvancedWebSocketServer:
             ping_interval=30,
             ping_timeout=10,
             close_timeout=10,
+            # 같은 프레임을 구독자마다 다시 압축하지 않도록 permessage-deflate 비활성화
+            # (스트림 메시지는 수백 바이트 JSON이라 압축 이득도 거의 없음)
+            compression=None,
         ):
             logger.info("서버가 실행 중입니다. Ctrl+C로 종료하세요.")
             await asyncio.Future()
@@ -546,14 +1099,14 @@ class AdvancedWebSocketClient:
     def __init__(self, uri: str, client_name: str = "AdvancedClient"):
         self.uri = uri
         self.client_name = client_name
-        self.websocket: Optional[websockets.WebSocketServerProtocol] = None
+        self.websocket: Optional[ClientConnection] = None
         self.running = False
         self.subscriptions: Set[StreamType] = set()
 
     async def connect(self) -> None:
         """서버에 연결"""
         try:
-            self.websocket = await websockets.connect(self.uri)
+            self.websocket = await websockets.connect(self.uri, compression=None)
             self.running = True
             logger.info(f"서버에 연결됨: {self.uri}")
         except Exception as e:
@@ -580,7 +1133,7 @@ class AdvancedWebSocketClient:
             "filters": filters or {},
         }
 
-        await self.websocket.send(json.dumps(message))
+        await self.websocket.send(orjson.dumps(message), text=True)
         self.subscriptions.update(stream_types)
         logger.info(f"구독 요청: {[t.value for t in stream_types]}")
 
@@ -590,7 +1143,7 @@ class AdvancedWebSocketClient:
             raise RuntimeError("서버에 연결되지 않았습니다")
 
         message = {"type": "unsubscribe"}
-        await self.websocket.send(json.dumps(message))
+        await self.websocket.send(orjson.dumps(message), text=True)
         self.subscriptions.clear()
         logger.info("구독 해제")
 
@@ -600,7 +1153,7 @@ class AdvancedWebSocketClient:
             raise RuntimeError("서버에 연결되지 않았습니다")
 
         message = {"type": "get_metrics"}
-        await self.websocket.send(json.dumps(message))
+        await self.websocket.send(orjson.dumps(message), text=True)
 
     async def get_aggregated_data(
         self, stream_type: StreamType, window_size: int = 100
@@ -614,7 +1167,7 @@ class AdvancedWebSocketClient:
             "stream_type": stream_type.value,
             "window_size": window_size,
         }
-        await self.websocket.send(json.dumps(message))
+        await self.websocket.send(orjson.dumps(message), text=True)
 
     async def listen_for_messages(self) -> None:
         """메시지 수신 대기"""
@@ -627,9 +1180,14 @@ class AdvancedWebSocketClient:
                     break
 
                 try:
-                    data = json.loads(message)
-                    await self._handle_message(data)
-                except json.JSONDecodeError:
+                    data = orjson.loads(message)
+                    # 서버가 여러 메시지를 JSON 배열 하나로 묶어 보낼 수 있음
+                    if isinstance(data, list):
+                        for item in data:
+                            await self._handle_message(item)
+                    else:
+                        await self._handle_message(data)
+                except orjson.JSONDecodeError:
                     logger.info(f"수신된 메시지: {message}")
 
         except ConnectionClosed:
@@ -16,14 +16,28 @@ AES 고급 사용법 및 실용적 예제
 
 import os
 import json
-import base64
+import mmap
+import contextlib
 import hashlib
+import itertools
 import secrets
 import sqlite3
 import socket
+import struct
 import threading
 import time
-from typing import Dict, List, Optional, Tuple, Union, BinaryIO
+from binascii import a2b_base64, b2a_base64
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    BinaryIO,
+)
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.primitives import hashes, padding, serialization
 from cryptography.hazmat.primitives.asymmetric import (
@@ -34,6 +48,76 @@ from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
 from cryptography.exceptions import InvalidKey, InvalidTag
 
+# 선택적 의존성: PyCryptodome (짧은 메시지의 GCM 호출 오버헤드가 더 작음)
+try:
+    from Crypto.Cipher import AES as PyCryptodomeAES
+except ImportError:
+    PyCryptodomeAES = None
+
+# 짧은 필드/메시지용 AES-GCM 구현 선택지
+AES_BACKENDS = ("cryptography", "pycryptodome")
+
+
+def _check_aes_backend(aes_backend: str) -> str:
+    """AES-GCM 구현 이름 검증"""
+    if aes_backend not in AES_BACKENDS:
+        raise ValueError(f"지원하지 않는 AES 백엔드입니다: {aes_backend}")
+    if aes_backend == "pycryptodome" and PyCryptodomeAES is None:
+        raise ImportError(
+            "pycryptodome 백엔드를 사용하려면 pycryptodome을 설치하세요"
+        )
+    return aes_backend
+
+
+def _aes_gcm(key: bytes, iv: bytes, aes_backend: str = "cryptography"):
+    """
+    AES-GCM 암호화 객체 생성
+
+    pycryptodome 백엔드는 encrypt_and_digest/decrypt_and_verify 한 번의 C
+    호출로 처리하는 PyCryptodome 객체를, 그 외에는 cryptography의 Cipher를
+    반환합니다.
+    """
+    if aes_backend == "pycryptodome":
+        return PyCryptodomeAES.new(key, PyCryptodomeAES.MODE_GCM, nonce=iv)
+    return Cipher(
+        algorithms.AES(key), modes.GCM(iv), backend=default_backend()
+    )
+
+
+def _gcm_encrypt(
+    key: bytes, iv: bytes, data: bytes, aes_backend: str = "cryptography"
+) -> Tuple[bytes, bytes]:
+    """AES-GCM 암호화 (암호문, 태그 반환)"""
+    cipher = _aes_gcm(key, iv, aes_backend)
+    if aes_backend == "pycryptodome":
+        return cipher.encrypt_and_digest(data)
+
+    encryptor = cipher.encryptor()
+    ciphertext = encryptor.update(data) + encryptor.finalize()
+    return ciphertext, encryptor.tag
+
+
+def _gcm_decrypt(
+    key: bytes,
+    iv: bytes,
+    tag: bytes,
+    ciphertext: bytes,
+    aes_backend: str = "cryptography",
+) -> bytes:
+    """AES-GCM 복호화 (태그 검증 실패 시 백엔드와 관계없이 InvalidTag)"""
+    if aes_backend == "pycryptodome":
+        try:
+            return _aes_gcm(key, iv, aes_backend).decrypt_and_verify(
+                ciphertext, tag
+            )
+        except ValueError as e:
+            raise InvalidTag() from e
+
+    decryptor = Cipher(
+        algorithms.AES(key), modes.GCM(iv, tag), backend=default_backend()
+    ).decryptor()
+    return decryptor.update(ciphertext) + decryptor.finalize()
+
 
 class HybridEncryption:
     """
@@ -70,34 +154,41 @@ class HybridEncryption:
         return private_key, public_key
 
     def encrypt_hybrid(
-        self, plaintext: str, public_key: rsa.RSAPublicKey
+        self,
+        plaintext: str,
+        public_key: rsa.RSAPublicKey,
+        additional_data: str = "",
     ) -> Dict[str, str]:
         """
-        하이브리드 암호화 (RSA + AES)
+        하이브리드 암호화 (RSA + AES-GCM)
 
         Args:
             plaintext: 암호화할 평문
             public_key: RSA 공개키
+            additional_data: 추가 인증 데이터 (암호화되지 않고 무결성만 보장)
 
         Returns:
             Dict[str, str]: 암호화된 데이터 (JSON 형태)
         """
         # AES 키 생성
         aes_key = secrets.token_bytes(32)  # 256비트
-        iv = secrets.token_bytes(16)
+        iv = secrets.token_bytes(12)  # GCM 권장 IV 길이
 
-        # AES로 평문 암호화
+        # AES-GCM으로 평문 암호화 (패딩 불필요, 인증 태그 생성)
         cipher = Cipher(
-            algorithms.AES(aes_key), modes.CBC(iv), backend=self.backend
+            algorithms.AES(aes_key), modes.GCM(iv), backend=self.backend
         )
         encryptor = cipher.encryptor()
 
-        # 패딩 추가
-        padder = padding.PKCS7(128).padder()
-        padded_data = padder.update(plaintext.encode("utf-8"))
-        padded_data += padder.finalize()
+        # AAD 추가
+        if additional_data:
+            encryptor.authenticate_additional_data(
+                additional_data.encode("utf-8")
+            )
 
-        ciphertext = encryptor.update(padded_data) + encryptor.finalize()
+        ciphertext = (
+            encryptor.update(plaintext.encode("utf-8")) + encryptor.finalize()
+        )
 
         # RSA로 AES 키 암호화
         encrypted_aes_key = public_key.encrypt(
@@ -110,16 +201,22 @@ class HybridEncryption:
         )
 
         return {
-            "ciphertext": base64.b64encode(ciphertext).decode("utf-8"),
-            "encrypted_key": base64.b64encode(encrypted_aes_key).decode(
-                "utf-8"
+            "ciphertext": b2a_base64(ciphertext, newline=False).decode(
+                "ascii"
             ),
-            "iv": base64.b64encode(iv).decode("utf-8"),
-            "algorithm": "RSA-OAEP+AES-256-CBC",
+            "encrypted_key": b2a_base64(
+                encrypted_aes_key, newline=False
+            ).decode("ascii"),
+            "iv": b2a_base64(iv, newline=False).decode("ascii"),
+            "tag": b2a_base64(encryptor.tag, newline=False).decode("ascii"),
+            "algorithm": "RSA-OAEP+AES-256-GCM",
         }
 
     def decrypt_hybrid(
-        self, encrypted_data: Dict[str, str], private_key: rsa.RSAPrivateKey
+        self,
+        encrypted_data: Dict[str, str],
+        private_key: rsa.RSAPrivateKey,
+        additional_data: str = "",
     ) -> str:
         """
         하이브리드 복호화
@@ -127,14 +224,19 @@ class HybridEncryption:
         Args:
             encrypted_data: 암호화된 데이터
             private_key: RSA 개인키
+            additional_data: 암호화할 때 사용한 추가 인증 데이터
 
         Returns:
             str: 복호화된 평문
+
+        Raises:
+            InvalidTag: 암호문, 태그 또는 추가 인증 데이터가 변조된 경우
         """
         # 데이터 디코딩
-        ciphertext = base64.b64decode(encrypted_data["ciphertext"])
-        encrypted_aes_key = base64.b64decode(encrypted_data["encrypted_key"])
-        iv = base64.b64decode(encrypted_data["iv"])
+        ciphertext = a2b_base64(encrypted_data["ciphertext"])
+        encrypted_aes_key = a2b_base64(encrypted_data["encrypted_key"])
+        iv = a2b_base64(encrypted_data["iv"])
+        tag = a2b_base64(encrypted_data["tag"])
 
         # RSA로 AES 키 복호화
         aes_key = private_key.decrypt(
@@ -146,36 +248,147 @@ class HybridEncryption:
             ),
         )
 
-        # AES로 평문 복호화
+        # AES-GCM으로 평문 복호화 (finalize에서 태그 검증)
         cipher = Cipher(
-            algorithms.AES(aes_key), modes.CBC(iv), backend=self.backend
+            algorithms.AES(aes_key), modes.GCM(iv, tag), backend=self.backend
         )
         decryptor = cipher.decryptor()
-        padded_data = decryptor.update(ciphertext) + decryptor.finalize()
 
-        # 패딩 제거
-        unpadder = padding.PKCS7(128).unpadder()
-        data = unpadder.update(padded_data)
-        data += unpadder.finalize()
+        if additional_data:
+            decryptor.authenticate_additional_data(
+                additional_data.encode("utf-8")
+            )
+
+        data = decryptor.update(ciphertext) + decryptor.finalize()
 
         return data.decode("utf-8")
 
+    def encrypt_hybrid_stream(
+        self, chunks: Iterable[str], public_key: rsa.RSAPublicKey
+    ) -> Iterator[Dict[str, str]]:
+        """
+        여러 메시지를 하나의 AES 키로 암호화하는 하이브리드 스트림
+
+        RSA-OAEP 암호화는 스트림 시작 시 한 번만 수행하고, 각 메시지는
+        같은 AES 키와 메시지 순번으로 만든 96비트 nonce로 AES-GCM 암호화합니다.
+        첫 번째 항목은 암호화된 AES 키를 담은 헤더입니다.
+
+        Args:
+            chunks: 암호화할 평문 목록
+            public_key: RSA 공개키
+
+        Yields:
+            Dict[str, str]: 헤더, 이어서 메시지별 암호문과 태그
+        """
+        aes_key = secrets.token_bytes(32)  # 256비트
+
+        # RSA로 AES 키 암호화 (스트림당 한 번)
+        encrypted_aes_key = public_key.encrypt(
+            aes_key,
+            asym_padding.OAEP(
+                mgf=asym_padding.MGF1(algorithm=hashes.SHA256()),
+                algorithm=hashes.SHA256(),
+                label=None,
+            ),
+        )
+
+        yield {
+            "encrypted_key": b2a_base64(
+                encrypted_aes_key, newline=False
+            ).decode("ascii"),
+            "algorithm": "RSA-OAEP+AES-256-GCM-STREAM",
+        }
+
+        algorithm = algorithms.AES(aes_key)
+        for i, chunk in enumerate(chunks):
+            # 메시지 순번을 nonce로 사용 (같은 키 안에서 중복되지 않음)
+            nonce = struct.pack(">IQ", 0, i)
+            encryptor = Cipher(
+                algorithm, modes.GCM(nonce), backend=self.backend
+            ).encryptor()
+            ciphertext = (
+                encryptor.update(chunk.encode("utf-8")) + encryptor.finalize()
+            )
+
+            yield {
+                "ciphertext": b2a_base64(ciphertext, newline=False).decode(
+                    "ascii"
+                ),
+                "tag": b2a_base64(encryptor.tag, newline=False).decode(
+                    "ascii"
+                ),
+            }
+
+    def decrypt_hybrid_stream(
+        self,
+        messages: Iterable[Dict[str, str]],
+        private_key: rsa.RSAPrivateKey,
+    ) -> Iterator[str]:
+        """
+        encrypt_hybrid_stream으로 만든 스트림 복호화
+
+        Args:
+            messages: 헤더와 암호화된 메시지들 (암호화한 순서대로)
+            private_key: RSA 개인키
+
+        Yields:
+            str: 복호화된 평문
+
+        Raises:
+            InvalidTag: 메시지가 변조되었거나 순서가 바뀐 경우
+        """
+        messages = iter(messages)
+        header = next(messages)
+
+        # RSA로 AES 키 복호화 (스트림당 한 번)
+        aes_key = private_key.decrypt(
+            a2b_base64(header["encrypted_key"]),
+            asym_padding.OAEP(
+                mgf=asym_padding.MGF1(algorithm=hashes.SHA256()),
+                algorithm=hashes.SHA256(),
+                label=None,
+            ),
+        )
+
+        algorithm = algorithms.AES(aes_key)
+        for i, message in enumerate(messages):
+            nonce = struct.pack(">IQ", 0, i)
+            tag = a2b_base64(message["tag"])
+            decryptor = Cipher(
+                algorithm, modes.GCM(nonce, tag), backend=self.backend
+            ).decryptor()
+            ciphertext = a2b_base64(message["ciphertext"])
+
+            data = decryptor.update(ciphertext) + decryptor.finalize()
+            yield data.decode("utf-8")
+
 
 class FileEncryption:
     """
     파일 암호화/복호화 클래스
     """
 
-    def __init__(self, key_length: int = 256):
+    # 한 번에 읽어 암호화할 크기 (1 MiB, OpenSSL이 여러 블록을 묶어 처리)
+    CHUNK_SIZE = 1 << 20
+    # 이 크기 이상의 파일은 CTR 스트라이프로 나눠 여러 스레드에서 처리
+    PARALLEL_THRESHOLD = 8 << 20
+    # 스레드 하나가 맡는 스트라이프 크기 (16바이트 블록의 배수)
+    STRIPE_SIZE = 4 << 20
+
+    def __init__(
+        self, key_length: int = 256, max_workers: Optional[int] = None
+    ):
         """
         파일 암호화 초기화
 
         Args:
             key_length: AES 키 길이
+            max_workers: 큰 파일 병렬 처리 스레드 수 (기본값: CPU 수)
         """
         self.key_length = key_length
         self.key_bytes = key_length // 8
         self.backend = default_backend()
+        self.max_workers = max_workers or os.cpu_count() or 1
 
     def generate_key(self) -> bytes:
         """암호화 키 생성"""
@@ -203,29 +416,8 @@ class FileEncryption:
             # IV 저장
             outfile.write(iv)
 
-            # 파일을 청크 단위로 암호화
-            cipher = Cipher(
-                algorithms.AES(key), modes.CBC(iv), backend=self.backend
-            )
-            encryptor = cipher.encryptor()
-
-            while True:
-                chunk = infile.read(1024)
-                if not chunk:
-                    break
-
-                # 마지막 청크가 아닌 경우 패딩 추가
-                if len(chunk) < 1024:
-                    padder = padding.PKCS7(128).padder()
-                    chunk = padder.update(chunk) + padder.finalize()
-
-                encrypted_chunk = encryptor.update(chunk)
-                outfile.write(encrypted_chunk)
-
-            # 마지막 청크 처리
-            final_chunk = encryptor.finalize()
-            if final_chunk:
-                outfile.write(final_chunk)
+            # 파일을 청크 단위로 암호화 (CTR 모드: 블록을 병렬 처리, 패딩 불필요)
+            self._ctr_transform(key, iv, infile, outfile, start=0)
 
     def decrypt_file(
         self, input_file: str, output_file: str, key: bytes
@@ -247,24 +439,82 @@ class FileEncryption:
             # IV 읽기
             iv = infile.read(16)
 
-            # 파일을 청크 단위로 복호화
+            # 파일을 청크 단위로 복호화 (CTR은 암호화와 복호화가 같은 연산)
+            self._ctr_transform(key, iv, infile, outfile, start=16)
+
+    def _ctr_transform(
+        self,
+        key: bytes,
+        iv: bytes,
+        infile: BinaryIO,
+        outfile: BinaryIO,
+        start: int,
+    ) -> None:
+        """
+        infile의 start 위치부터 끝까지 AES-CTR로 변환하여 outfile에 기록
+
+        큰 파일은 mmap으로 열어 STRIPE_SIZE 단위로 나누고, 각 스트라이프의
+        카운터를 블록 오프셋으로 계산해 스레드 풀에서 동시에 처리합니다.
+        """
+        size = os.fstat(infile.fileno()).st_size - start
+        if size < self.PARALLEL_THRESHOLD or self.max_workers == 1:
             cipher = Cipher(
-                algorithms.AES(key), modes.CBC(iv), backend=self.backend
+                algorithms.AES(key), modes.CTR(iv), backend=self.backend
             )
-            decryptor = cipher.decryptor()
+            encryptor = cipher.encryptor()
+
+            # 입력/출력 버퍼를 한 번만 할당해 청크마다 bytes 객체를 만들지 않음
+            # (update_into는 출력 버퍼에 블록 크기 - 1 바이트 여유가 필요)
+            buf_size = max(1, min(size, self.CHUNK_SIZE))
+            in_buf = bytearray(buf_size)
+            out_buf = bytearray(buf_size + 15)
+            in_view = memoryview(in_buf)
+            out_view = memoryview(out_buf)
 
             while True:
-                chunk = infile.read(1024)
-                if not chunk:
+                n = infile.readinto(in_buf)
+                if not n:
                     break
 
-                decrypted_chunk = decryptor.update(chunk)
-                outfile.write(decrypted_chunk)
+                written = encryptor.update_into(in_view[:n], out_buf)
+                outfile.write(out_view[:written])
+
+            encryptor.finalize()
+            return
 
-            # 마지막 청크 처리
-            final_chunk = decryptor.finalize()
-            if final_chunk:
-                outfile.write(final_chunk)
+        algorithm = algorithms.AES(key)
+        initial_counter = int.from_bytes(iv, "big")
+
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            data = memoryview(mm)[start:]
+
+            def transform_stripe(offset: int) -> bytes:
+                counter = (initial_counter + offset // 16) % (1 << 128)
+                encryptor = Cipher(
+                    algorithm,
+                    modes.CTR(counter.to_bytes(16, "big")),
+                    backend=self.backend,
+                ).encryptor()
+                with data[offset : offset + self.STRIPE_SIZE] as stripe:
+                    return encryptor.update(stripe)
+
+            try:
+                offsets = range(0, len(data), self.STRIPE_SIZE)
+                # 메모리에 쌓이는 결과를 제한하도록 스레드 수의 2배씩 나눠 처리
+                window = self.max_workers * 2
+                with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                    for i in range(0, len(offsets), window):
+                        batch = offsets[i : i + window]
+                        for encrypted in pool.map(transform_stripe, batch):
+                            outfile.write(encrypted)
+            finally:
+                data.release()
+
+
+_INSERT_USER_SQL = """
+    INSERT INTO users (username, email, encrypted_phone, encrypted_address)
+    VALUES (?, ?, ?, ?)
+"""
 
 
 class DatabaseEncryption:
@@ -272,16 +522,66 @@ class DatabaseEncryption:
     데이터베이스 암호화 클래스
     """
 
-    def __init__(self, key_length: int = 256):
+    def __init__(
+        self, key_length: int = 256, aes_backend: str = "cryptography"
+    ):
         """
         데이터베이스 암호화 초기화
 
         Args:
             key_length: AES 키 길이
+            aes_backend: 필드 암호화에 쓸 AES-GCM 구현
+                ("cryptography" 또는 "pycryptodome")
         """
         self.key_length = key_length
         self.key_bytes = key_length // 8
         self.backend = default_backend()
+        self.aes_backend = _check_aes_backend(aes_backend)
+        # session()으로 연 연결 (없으면 메서드마다 연결을 열고 닫음)
+        self.conn: Optional[sqlite3.Connection] = None
+
+    def session(self, db_path: str) -> "DatabaseEncryption":
+        """
+        연결을 하나 열어 두고 여러 작업에 재사용하는 세션 시작
+
+        with 문과 함께 사용하면 블록이 끝날 때 연결을 닫습니다.
+
+        Args:
+            db_path: 데이터베이스 파일 경로
+
+        Returns:
+            DatabaseEncryption: 연결이 열린 자기 자신
+        """
+        self.close()
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        return self
+
+    def close(self) -> None:
+        """세션 연결 닫기"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self) -> "DatabaseEncryption":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @contextlib.contextmanager
+    def _connect(self, db_path: str) -> Iterator[sqlite3.Connection]:
+        """세션 연결이 있으면 재사용하고, 없으면 이번 작업용 연결을 엶"""
+        if self.conn is not None:
+            yield self.conn
+            return
+
+        conn = sqlite3.connect(db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
 
     def generate_key(self) -> bytes:
         """암호화 키 생성"""
@@ -289,35 +589,89 @@ class DatabaseEncryption:
 
     def encrypt_field(self, data: str, key: bytes) -> str:
         """
-        데이터베이스 필드 암호화
+        데이터베이스 필드 암호화 (AES-256-GCM)
 
         Args:
             data: 암호화할 데이터
             key: 암호화 키
 
         Returns:
-            str: 암호화된 데이터 (Base64 인코딩)
+            str: 암호화된 데이터 (IV + 태그 + 암호문의 Base64 인코딩)
         """
         if len(key) != self.key_bytes:
             raise ValueError(f"키 길이가 {self.key_bytes}바이트여야 합니다")
 
-        iv = secrets.token_bytes(16)
+        iv = secrets.token_bytes(12)  # GCM 권장 IV 길이
 
-        cipher = Cipher(
-            algorithms.AES(key), modes.CBC(iv), backend=self.backend
+        # GCM은 패딩이 필요 없고 인증 태그로 변조를 검출
+        ciphertext, tag = _gcm_encrypt(
+            key, iv, data.encode("utf-8"), self.aes_backend
         )
-        encryptor = cipher.encryptor()
 
-        # 패딩 추가
-        padder = padding.PKCS7(128).padder()
-        padded_data = padder.update(data.encode("utf-8"))
-        padded_data += padder.finalize()
+        # IV, 태그, 암호문을 결합하여 Base64 인코딩
+        combined = iv + tag + ciphertext
+        return b2a_base64(combined, newline=False).decode("ascii")
 
-        ciphertext = encryptor.update(padded_data) + encryptor.finalize()
+    def encrypt_fields_batch(self, values: List[str], key: bytes) -> List[str]:
+        """
+        여러 필드를 한 번에 암호화
 
-        # IV와 암호문을 결합하여 Base64 인코딩
-        combined = iv + ciphertext
-        return base64.b64encode(combined).decode("utf-8")
+        Args:
+            values: 암호화할 데이터 목록
+            key: 암호화 키
+
+        Returns:
+            List[str]: encrypt_field와 같은 형식의 암호화된 데이터 목록
+        """
+        return self.encrypt_many(
+            [value.encode("utf-8") for value in values], key
+        )
+
+    def encrypt_many(self, rows: List[bytes], key: bytes) -> List[str]:
+        """
+        이미 인코딩된 여러 값을 한 번에 암호화
+
+        모든 IV는 한 번의 난수 호출로 만든 연속 버퍼에서 잘라 쓰고, AES
+        알고리즘 객체와 자주 쓰는 함수는 루프 밖에서 한 번만 준비합니다.
+        aes_backend가 pycryptodome이면 행마다 그 구현으로 암호화합니다.
+
+        Args:
+            rows: 암호화할 데이터 (bytes) 목록
+            key: 암호화 키
+
+        Returns:
+            List[str]: encrypt_field와 같은 형식의 암호화된 데이터 목록
+        """
+        if len(key) != self.key_bytes:
+            raise ValueError(f"키 길이가 {self.key_bytes}바이트여야 합니다")
+
+        ivs = secrets.token_bytes(12 * len(rows))
+        b2a = b2a_base64
+        results = []
+
+        if self.aes_backend != "cryptography":
+            for i, row in enumerate(rows):
+                iv = ivs[12 * i : 12 * (i + 1)]
+                ciphertext, tag = _gcm_encrypt(key, iv, row, self.aes_backend)
+                record = iv + tag + ciphertext
+                results.append(b2a(record, newline=False).decode("ascii"))
+            return results
+
+        algorithm = algorithms.AES(key)
+        gcm = modes.GCM
+
+        for i, row in enumerate(rows):
+            iv = ivs[12 * i : 12 * (i + 1)]
+            encryptor = Cipher(
+                algorithm, gcm(iv), backend=self.backend
+            ).encryptor()
+            ciphertext = encryptor.update(row)
+            encryptor.finalize()  # GCM은 스트림 모드라 남는 바이트가 없음
+
+            record = iv + encryptor.tag + ciphertext
+            results.append(b2a(record, newline=False).decode("ascii"))
+
+        return results
 
     def decrypt_field(self, encrypted_data: str, key: bytes) -> str:
         """
@@ -329,26 +683,20 @@ class DatabaseEncryption:
 
         Returns:
             str: 복호화된 데이터
+
+        Raises:
+            InvalidTag: 암호화된 데이터가 변조된 경우
         """
         if len(key) != self.key_bytes:
             raise ValueError(f"키 길이가 {self.key_bytes}바이트여야 합니다")
 
         # Base64 디코딩
-        combined = base64.b64decode(encrypted_data)
-        iv = combined[:16]
-        ciphertext = combined[16:]
+        combined = a2b_base64(encrypted_data)
+        iv = combined[:12]
+        tag = combined[12:28]
+        ciphertext = combined[28:]
 
-        cipher = Cipher(
-            algorithms.AES(key), modes.CBC(iv), backend=self.backend
-        )
-        decryptor = cipher.decryptor()
-
-        padded_data = decryptor.update(ciphertext) + decryptor.finalize()
-
-        # 패딩 제거
-        unpadder = padding.PKCS7(128).unpadder()
-        data = unpadder.update(padded_data)
-        data += unpadder.finalize()
+        data = _gcm_decrypt(key, iv, tag, ciphertext, self.aes_backend)
 
         return data.decode("utf-8")
 
@@ -360,25 +708,24 @@ class DatabaseEncryption:
             db_path: 데이터베이스 파일 경로
             key: 암호화 키
         """
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # 사용자 테이블 생성
-        cursor.execute(
+        with self._connect(db_path) as conn:
+            cursor = conn.cursor()
+
+            # 사용자 테이블 생성
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    username TEXT NOT NULL,
+                    email TEXT NOT NULL,
+                    encrypted_phone TEXT,
+                    encrypted_address TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
             """
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT NOT NULL,
-                email TEXT NOT NULL,
-                encrypted_phone TEXT,
-                encrypted_address TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
-        """
-        )
 
-        conn.commit()
-        conn.close()
+            conn.commit()
 
     def insert_encrypted_user(
         self,
@@ -400,23 +747,50 @@ class DatabaseEncryption:
             phone: 전화번호
             address: 주소
         """
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
         # 민감한 데이터 암호화
         encrypted_phone = self.encrypt_field(phone, key)
         encrypted_address = self.encrypt_field(address, key)
 
-        cursor.execute(
-            """
-            INSERT INTO users (username, email, encrypted_phone, encrypted_address)
-            VALUES (?, ?, ?, ?)
-        """,
-            (username, email, encrypted_phone, encrypted_address),
+        with self._connect(db_path) as conn:
+            conn.execute(
+                _INSERT_USER_SQL,
+                (username, email, encrypted_phone, encrypted_address),
+            )
+            conn.commit()
+
+    def insert_many(
+        self, key: bytes, rows: List[Tuple[str, str, str, str]]
+    ) -> None:
+        """
+        여러 사용자를 한 번에 암호화하여 삽입 (세션 연결 필요)
+
+        민감한 필드를 일괄 암호화한 뒤 executemany 한 번으로 삽입하고
+        커밋도 한 번만 합니다.
+
+        Args:
+            key: 암호화 키
+            rows: (사용자명, 이메일, 전화번호, 주소) 목록
+        """
+        if self.conn is None:
+            raise RuntimeError("session()으로 데이터베이스 연결을 먼저 여세요")
+
+        encrypted_phones = self.encrypt_fields_batch(
+            [row[2] for row in rows], key
+        )
+        encrypted_addresses = self.encrypt_fields_batch(
+            [row[3] for row in rows], key
         )
 
-        conn.commit()
-        conn.close()
+        self.conn.executemany(
+            _INSERT_USER_SQL,
+            [
+                (username, email, phone, address)
+                for (username, email, _, _), phone, address in zip(
+                    rows, encrypted_phones, encrypted_addresses
+                )
+            ],
+        )
+        self.conn.commit()
 
     def get_encrypted_user(
         self, db_path: str, key: bytes, user_id: int
@@ -432,19 +806,18 @@ class DatabaseEncryption:
         Returns:
             Dict[str, str]: 복호화된 사용자 데이터
         """
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            SELECT username, email, encrypted_phone, encrypted_address
-            FROM users WHERE id = ?
-        """,
-            (user_id,),
-        )
+        with self._connect(db_path) as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                SELECT username, email, encrypted_phone, encrypted_address
+                FROM users WHERE id = ?
+            """,
+                (user_id,),
+            )
 
-        row = cursor.fetchone()
-        conn.close()
+            row = cursor.fetchone()
 
         if not row:
             return {}
@@ -459,56 +832,189 @@ class DatabaseEncryption:
         }
 
 
+# 네트워크 메시지 프레임: 4바이트 빅엔디언 길이 + 암호화된 메시지
+FRAME_HEADER_SIZE = 4
+MAX_FRAME_SIZE = 1 << 20
+
+
+def _recv_exactly(sock: socket.socket, view: memoryview) -> bool:
+    """
+    view를 가득 채울 때까지 recv_into로 수신 (새 bytes를 만들지 않음)
+
+    Returns:
+        bool: 채웠으면 True, 아무것도 받기 전에 연결이 닫혔으면 False
+
+    Raises:
+        ConnectionError: 프레임 중간에 연결이 끊긴 경우
+    """
+    received = 0
+    while received < len(view):
+        n = sock.recv_into(view[received:])
+        if not n:
+            if received == 0:
+                return False
+            raise ConnectionError("프레임 수신 중 연결이 끊겼습니다")
+        received += n
+    return True
+
+
+def send_frame(sock: socket.socket, payload: bytes) -> None:
+    """길이 접두어를 붙여 메시지 하나를 빠짐없이 전송"""
+    sock.sendall(len(payload).to_bytes(FRAME_HEADER_SIZE, "big") + payload)
+
+
+def recv_frame(sock: socket.socket) -> Optional[bytearray]:
+    """
+    길이 접두어 프레임 하나 수신
+
+    TCP가 메시지를 합치거나 나눠 보내도 정확히 한 메시지를 돌려줍니다.
+
+    Returns:
+        Optional[bytearray]: 수신한 메시지 (연결이 정상 종료되면 None)
+
+    Raises:
+        ConnectionError: 프레임 중간에 연결이 끊긴 경우
+        ValueError: 프레임 길이가 MAX_FRAME_SIZE를 넘는 경우
+    """
+    header = bytearray(FRAME_HEADER_SIZE)
+    if not _recv_exactly(sock, memoryview(header)):
+        return None
+
+    size = int.from_bytes(header, "big")
+    if size > MAX_FRAME_SIZE:
+        raise ValueError(f"프레임이 너무 큽니다: {size}바이트")
+
+    payload = bytearray(size)
+    if size and not _recv_exactly(sock, memoryview(payload)):
+        raise ConnectionError("프레임 수신 중 연결이 끊겼습니다")
+    return payload
+
+
+class NetworkSession:
+    """
+    키 하나로 여러 메시지를 암호화하는 세션 (AES-256-GCM)
+
+    AES 알고리즘 객체는 세션을 만들 때 한 번만 생성합니다. nonce는 세션마다
+    무작위인 8바이트 접두어와 4바이트 카운터로 만들므로 같은 키를 쓰는
+    상대방 세션과도 겹치지 않고, 메시지마다 난수를 새로 뽑지 않습니다.
+    """
+
+    def __init__(
+        self, key: bytes, backend=None, aes_backend: str = "cryptography"
+    ):
+        self._key = key
+        self._algorithm = algorithms.AES(key)
+        self._backend = backend or default_backend()
+        self._aes_backend = _check_aes_backend(aes_backend)
+        self._nonce_prefix = secrets.token_bytes(8)
+        self._counter = itertools.count()
+
+    def _next_nonce(self) -> bytes:
+        """96비트 nonce 생성 (접두어 8바이트 + 카운터 4바이트)"""
+        count = next(self._counter)
+        if count > 0xFFFFFFFF:
+            raise RuntimeError("nonce 카운터가 소진되었습니다 - 새 세션을 만드세요")
+        return self._nonce_prefix + count.to_bytes(4, "big")
+
+    def encrypt(self, message: str) -> bytes:
+        """메시지 암호화 (nonce + 태그 + 암호문 반환)"""
+        nonce = self._next_nonce()
+        if self._aes_backend == "pycryptodome":
+            ciphertext, tag = _gcm_encrypt(
+                self._key, nonce, message.encode("utf-8"), self._aes_backend
+            )
+            return nonce + tag + ciphertext
+
+        encryptor = Cipher(
+            self._algorithm, modes.GCM(nonce), backend=self._backend
+        ).encryptor()
+        ciphertext = (
+            encryptor.update(message.encode("utf-8")) + encryptor.finalize()
+        )
+        return nonce + encryptor.tag + ciphertext
+
+    def decrypt(self, encrypted_message: Union[bytes, bytearray]) -> str:
+        """메시지 복호화 (태그 검증 실패 시 InvalidTag)"""
+        # recv_frame의 bytearray도 받도록 암호문은 복사 없이 memoryview로 참조
+        view = memoryview(encrypted_message)
+        nonce = bytes(view[:12])
+        tag = bytes(view[12:28])
+        ciphertext = view[28:]
+
+        if self._aes_backend == "pycryptodome":
+            data = _gcm_decrypt(
+                self._key, nonce, tag, ciphertext, self._aes_backend
+            )
+            return data.decode("utf-8")
+
+        decryptor = Cipher(
+            self._algorithm, modes.GCM(nonce, tag), backend=self._backend
+        ).decryptor()
+        data = decryptor.update(ciphertext) + decryptor.finalize()
+        return data.decode("utf-8")
+
+
 class NetworkEncryption:
     """
     네트워크 통신 암호화 클래스
     """
 
-    def __init__(self, key_length: int = 256):
+    def __init__(
+        self, key_length: int = 256, aes_backend: str = "cryptography"
+    ):
         """
         네트워크 암호화 초기화
 
         Args:
             key_length: AES 키 길이
+            aes_backend: 메시지 암호화에 쓸 AES-GCM 구현
+                ("cryptography" 또는 "pycryptodome")
         """
         self.key_length = key_length
         self.key_bytes = key_length // 8
         self.backend = default_backend()
+        self.aes_backend = _check_aes_backend(aes_backend)
+        # encrypt_message/decrypt_message가 키별로 재사용하는 세션
+        self._sessions: Dict[bytes, NetworkSession] = {}
 
     def generate_key(self) -> bytes:
         """암호화 키 생성"""
         return secrets.token_bytes(self.key_bytes)
 
-    def encrypt_message(self, message: str, key: bytes) -> bytes:
+    def session(self, key: bytes) -> "NetworkSession":
         """
-        메시지 암호화
+        키 하나로 여러 메시지를 암호화/복호화할 세션 생성
 
         Args:
-            message: 암호화할 메시지
             key: 암호화 키
 
         Returns:
-            bytes: 암호화된 메시지
+            NetworkSession: 암호화 세션
         """
         if len(key) != self.key_bytes:
             raise ValueError(f"키 길이가 {self.key_bytes}바이트여야 합니다")
 
-        iv = secrets.token_bytes(16)
+        return NetworkSession(key, self.backend, self.aes_backend)
 
-        cipher = Cipher(
-            algorithms.AES(key), modes.CBC(iv), backend=self.backend
-        )
-        encryptor = cipher.encryptor()
+    def _session_for(self, key: bytes) -> "NetworkSession":
+        """키별로 캐시한 세션 반환 (없으면 생성)"""
+        session = self._sessions.get(key)
+        if session is None:
+            session = self._sessions.setdefault(key, self.session(key))
+        return session
 
-        # 패딩 추가
-        padder = padding.PKCS7(128).padder()
-        padded_data = padder.update(message.encode("utf-8"))
-        padded_data += padder.finalize()
+    def encrypt_message(self, message: str, key: bytes) -> bytes:
+        """
+        메시지 암호화 (AES-256-GCM)
 
-        ciphertext = encryptor.update(padded_data) + encryptor.finalize()
+        Args:
+            message: 암호화할 메시지
+            key: 암호화 키
 
-        # IV와 암호문을 결합
-        return iv + ciphertext
+        Returns:
+            bytes: 암호화된 메시지 (nonce + 태그 + 암호문)
+        """
+        return self._session_for(key).encrypt(message)
 
     def decrypt_message(self, encrypted_message: bytes, key: bytes) -> str:
         """
@@ -520,26 +1026,11 @@ class NetworkEncryption:
 
         Returns:
             str: 복호화된 메시지
-        """
-        if len(key) != self.key_bytes:
-            raise ValueError(f"키 길이가 {self.key_bytes}바이트여야 합니다")
-
-        iv = encrypted_message[:16]
-        ciphertext = encrypted_message[16:]
-
-        cipher = Cipher(
-            algorithms.AES(key), modes.CBC(iv), backend=self.backend
-        )
-        decryptor = cipher.decryptor()
-
-        padded_data = decryptor.update(ciphertext) + decryptor.finalize()
 
-        # 패딩 제거
-        unpadder = padding.PKCS7(128).unpadder()
-        data = unpadder.update(padded_data)
-        data += unpadder.finalize()
-
-        return data.decode("utf-8")
+        Raises:
+            InvalidTag: 메시지가 변조된 경우
+        """
+        return self._session_for(key).decrypt(encrypted_message)
 
     def start_encrypted_server(self, host: str, port: int, key: bytes) -> None:
         """
@@ -553,24 +1044,26 @@ class NetworkEncryption:
 
         def handle_client(client_socket, addr):
             print(f"클라이언트 연결: {addr}")
+            # 연결마다 세션 하나를 만들어 모든 메시지에 재사용
+            session = self.session(key)
+            # 루프에서 매번 속성을 찾지 않도록 메서드를 지역 변수에 바인딩
+            decrypt = session.decrypt
+            encrypt = session.encrypt
 
             try:
                 while True:
-                    # 암호화된 메시지 수신
-                    encrypted_data = client_socket.recv(1024)
-                    if not encrypted_data:
+                    # 암호화된 메시지 수신 (길이 접두어 프레임 단위)
+                    encrypted_data = recv_frame(client_socket)
+                    if encrypted_data is None:
                         break
 
                     # 메시지 복호화
-                    decrypted_message = self.decrypt_message(
-                        encrypted_data, key
-                    )
+                    decrypted_message = decrypt(encrypted_data)
                     print(f"수신된 메시지: {decrypted_message}")
 
                     # 응답 암호화 및 전송
                     response = f"서버 응답: {decrypted_message}"
-                    encrypted_response = self.encrypt_message(response, key)
-                    client_socket.send(encrypted_response)
+                    send_frame(client_socket, encrypt(response))
 
             except Exception as e:
                 print(f"클라이언트 처리 오류: {e}")
@@ -614,10 +1107,12 @@ class NetworkEncryption:
 
             # 메시지 암호화 및 전송
             encrypted_message = self.encrypt_message(message, key)
-            client_socket.send(encrypted_message)
+            send_frame(client_socket, encrypted_message)
 
             # 응답 수신 및 복호화
-            encrypted_response = client_socket.recv(1024)
+            encrypted_response = recv_frame(client_socket)
+            if encrypted_response is None:
+                raise ConnectionError("서버가 응답 없이 연결을 닫았습니다")
             decrypted_response = self.decrypt_message(encrypted_response, key)
             print(f"서버 응답: {decrypted_response}")
 
@@ -652,6 +1147,16 @@ def demonstrate_hybrid_encryption():
     print(f"복호화된 평문: {decrypted_text}")
     print(f"복호화 성공: {plaintext == decrypted_text}")
 
+    # 하이브리드 스트림: RSA 한 번으로 여러 메시지 암호화
+    messages = [f"스트림 메시지 {i}" for i in range(5)]
+    stream = list(hybrid.encrypt_hybrid_stream(messages, public_key))
+    print(f"스트림 암호화: 헤더 1개 + 메시지 {len(stream) - 1}개")
+
+    decrypted_messages = list(
+        hybrid.decrypt_hybrid_stream(stream, private_key)
+    )
+    print(f"스트림 복호화 성공: {messages == decrypted_messages}")
+
 
 def demonstrate_file_encryption():
     """파일 암호화 데모"""
@@ -702,30 +1207,30 @@ def demonstrate_database_encryption():
 
     db_enc = DatabaseEncryption(key_length=256)
     key = db_enc.generate_key()
-
-    # 데이터베이스 생성
     db_path = "encrypted_users.db"
-    db_enc.create_encrypted_database(db_path, key)
-    print(f"암호화된 데이터베이스 생성: {db_path}")
-
-    # 사용자 데이터 삽입
-    users = [
-        ("김철수", "kim@example.com", "010-1234-5678", "서울시 강남구"),
-        ("이영희", "lee@example.com", "010-9876-5432", "부산시 해운대구"),
-        ("박민수", "park@example.com", "010-5555-1234", "대구시 수성구"),
-    ]
-
-    for username, email, phone, address in users:
-        db_enc.insert_encrypted_user(
-            db_path, key, username, email, phone, address
-        )
-        print(f"사용자 추가: {username}")
 
-    # 사용자 데이터 조회
-    print("\n암호화된 사용자 데이터 조회:")
-    for user_id in range(1, 4):
-        user_data = db_enc.get_encrypted_user(db_path, key, user_id)
-        print(f"사용자 {user_id}: {user_data}")
+    # 연결 하나를 열어 두고 생성/삽입/조회에 재사용
+    with db_enc.session(db_path):
+        # 데이터베이스 생성
+        db_enc.create_encrypted_database(db_path, key)
+        print(f"암호화된 데이터베이스 생성: {db_path}")
+
+        # 사용자 데이터 일괄 삽입
+        users = [
+            ("김철수", "kim@example.com", "010-1234-5678", "서울시 강남구"),
+            ("이영희", "lee@example.com", "010-9876-5432", "부산시 해운대구"),
+            ("박민수", "park@example.com", "010-5555-1234", "대구시 수성구"),
+        ]
+
+        db_enc.insert_many(key, users)
+        for username, _, _, _ in users:
+            print(f"사용자 추가: {username}")
+
+        # 사용자 데이터 조회
+        print("\n암호화된 사용자 데이터 조회:")
+        for user_id in range(1, 4):
+            user_data = db_enc.get_encrypted_user(db_path, key, user_id)
+            print(f"사용자 {user_id}: {user_data}")
 
     # 데이터베이스 정리
     if os.path.exists(db_path):
@@ -798,8 +1303,10 @@ def demonstrate_cloud_storage_encryption():
             ciphertext = encryptor.update(padded_data) + encryptor.finalize()
 
             return {
-                "encrypted_data": base64.b64encode(ciphertext).decode("utf-8"),
-                "iv": base64.b64encode(iv).decode("utf-8"),
+                "encrypted_data": b2a_base64(ciphertext, newline=False).decode(
+                    "ascii"
+                ),
+                "iv": b2a_base64(iv, newline=False).decode("ascii"),
                 "algorithm": "AES-256-CBC",
             }
 
@@ -807,8 +1314,8 @@ def demonstrate_cloud_storage_encryption():
             self, encrypted_data: Dict[str, str]
         ) -> Tuple[str, str]:
             """클라우드에서 복호화"""
-            ciphertext = base64.b64decode(encrypted_data["encrypted_data"])
-            iv = base64.b64decode(encrypted_data["iv"])
+            ciphertext = a2b_base64(encrypted_data["encrypted_data"])
+            iv = a2b_base64(encrypted_data["iv"])
 
             cipher = Cipher(
                 algorithms.AES(self.key), modes.CBC(iv), backend=self.backend
@@ -872,33 +1379,23 @@ def demonstrate_streaming_encryption():
                 algorithms.AES(key), modes.CBC(self.iv), backend=self.backend
             )
             self.encryptor = self.cipher.encryptor()
-            self.buffer = b""
+            # 블록 경계에 못 미친 꼬리 바이트는 네이티브 암호화 객체가 보관
+            # (패더는 길이만 세고 데이터를 그대로 넘겨 마지막에 패딩 추가)
+            self.padder = padding.PKCS7(128).padder()
+            # 청크마다 호출되는 메서드는 미리 바인딩해 속성 조회를 줄임
+            self._encrypt = self.encryptor.update
+            self._pad = self.padder.update
 
         def encrypt_chunk(self, chunk: bytes) -> bytes:
-            """청크 암호화"""
-            self.buffer += chunk
-
-            # 16바이트 단위로 처리
-            encrypted_chunks = b""
-            while len(self.buffer) >= 16:
-                block = self.buffer[:16]
-                self.buffer = self.buffer[16:]
-                encrypted_chunks += self.encryptor.update(block)
-
-            return encrypted_chunks
+            """청크 암호화 (완성된 16바이트 블록만큼의 암호문 반환)"""
+            return self._encrypt(self._pad(chunk))
 
         def finalize(self) -> bytes:
             """마지막 블록 처리"""
-            if self.buffer:
-                # 패딩 추가
-                padder = padding.PKCS7(128).padder()
-                padded_data = padder.update(self.buffer)
-                padded_data += padder.finalize()
-                return (
-                    self.encryptor.update(padded_data)
-                    + self.encryptor.finalize()
-                )
-            return self.encryptor.finalize()
+            return (
+                self.encryptor.update(self.padder.finalize())
+                + self.encryptor.finalize()
+            )
 
     # 스트리밍 암호화 시뮬레이션
     key = secrets.token_bytes(32)